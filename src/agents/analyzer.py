@@ -1,6 +1,7 @@
 """Analyzer Agent - Parses and understands SSIS packages."""
 
 import re
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Optional
 
@@ -22,15 +23,15 @@ from .base import (
 from .context import MigrationContext
 
 
+@dataclass(slots=True)
 class DependencyNode:
     """Node in the task dependency graph."""
 
-    def __init__(self, task_id: str, task_name: str, task_type: str):
-        self.task_id = task_id
-        self.task_name = task_name
-        self.task_type = task_type
-        self.dependencies: list[str] = []
-        self.dependents: list[str] = []
+    task_id: str
+    task_name: str
+    task_type: str
+    dependencies: list[str] = field(default_factory=list)
+    dependents: list[str] = field(default_factory=list)
 
 
 class DependencyGraph:
@@ -196,12 +197,12 @@ class AnalyzerAgent(BaseAgent):
                 for package in packages:
                     self.log(f"Analyzing package: {package.name}")
 
-                    # Convert to dict for storage
-                    package_dict = package.model_dump()
+                    # Convert to a JSON-ready dict once, for storage and LLM prompts
+                    package_dict = package.model_dump(mode="json")
                     result.packages.append(package_dict)
 
                     # Detect load pattern
-                    pattern = await self._detect_load_pattern(package)
+                    pattern = await self._detect_load_pattern(package, package_dict)
                     result.load_patterns[package.name] = pattern
 
                     # Build dependency graph
@@ -238,9 +239,16 @@ class AnalyzerAgent(BaseAgent):
             )
 
     async def _detect_load_pattern(
-        self, package: SSISPackage
+        self,
+        package: SSISPackage,
+        package_dict: Optional[dict[str, Any]] = None,
     ) -> LoadPatternDetails:
-        """Detect the load pattern of a package."""
+        """
+        Detect the load pattern of a package.
+
+        package_dict is the package's existing JSON-mode dump, reused for the
+        LLM prompt instead of dumping the package a second time.
+        """
         indicators: list[str] = []
         variables_used: list[str] = []
         date_columns: list[str] = []
@@ -307,9 +315,9 @@ class AnalyzerAgent(BaseAgent):
         # Use LLM for enhanced detection if available
         if self.llm_client and confidence < 0.8:
             try:
-                llm_result = await self.llm_client.detect_load_pattern(
-                    package.model_dump()
-                )
+                if package_dict is None:
+                    package_dict = package.model_dump(mode="json")
+                llm_result = await self.llm_client.detect_load_pattern(package_dict)
                 if llm_result.get("confidence", 0) > confidence:
                     pattern = LoadPattern(llm_result.get("pattern", pattern.value))
                     confidence = llm_result.get("confidence", confidence)
@@ -161,19 +161,14 @@ class StatePersistence:
     def save_state(self, context: MigrationContext) -> Path:
         """Save current state to disk."""
         state_file = self.state_dir / f"migration_{context.run_id}.json"
-        with open(state_file, "w") as f:
-            json.dump(
-                context.model_dump(mode="json"),
-                f,
-                indent=2,
-                default=str,
-            )
+        with open(state_file, "w", encoding="utf-8") as f:
+            f.write(context.model_dump_json(indent=2))
         return state_file
 
     def load_state(self, run_id: str) -> MigrationContext:
         """Load state from disk."""
         state_file = self.state_dir / f"migration_{run_id}.json"
-        with open(state_file) as f:
+        with open(state_file, encoding="utf-8") as f:
             data = json.load(f)
         return MigrationContext(**data)
 
@@ -1,6 +1,7 @@
 """Diagnoser Agent - Analyzes validation failures and suggests fixes."""
 
 import re
+from dataclasses import dataclass, field
 from typing import Any, Optional
 
 from .base import BaseAgent, AgentResult, AgentStatus
@@ -35,17 +36,17 @@ def safe_identifier(name: str) -> str:
     return "[INVALID_IDENTIFIER]"
 
 
+@dataclass(slots=True)
 class DiagnosisResult:
     """Result of failure diagnosis."""
 
-    def __init__(self):
-        self.root_cause: str = ""
-        self.category: str = ""
-        self.confidence: float = 0.0
-        self.suggested_fixes: list[dict[str, Any]] = []
-        self.requires_manual_review: bool = False
-        self.can_auto_fix: bool = False
-        self.investigation_queries: list[str] = []
+    root_cause: str = ""
+    category: str = ""
+    confidence: float = 0.0
+    suggested_fixes: list[dict[str, Any]] = field(default_factory=list)
+    requires_manual_review: bool = False
+    can_auto_fix: bool = False
+    investigation_queries: list[str] = field(default_factory=list)
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -163,7 +163,12 @@ class ExecutorAgent(BaseAgent):
                 errors=[str(e)],
             )
 
-    def _validate_path(self, file_path: Path, base_path: Path) -> Path:
+    def _validate_path(
+        self,
+        file_path: Path,
+        base_path: Path,
+        resolved_base: Optional[Path] = None,
+    ) -> Path:
         """
         Validate that a file path is safely within the base path.
 
@@ -173,6 +178,8 @@ class ExecutorAgent(BaseAgent):
         Args:
             file_path: The path to validate
             base_path: The base directory that should contain file_path
+            resolved_base: base_path already resolved, so callers validating
+                many files can resolve the base directory only once
 
         Returns:
             The resolved absolute path if valid
@@ -181,7 +188,8 @@ class ExecutorAgent(BaseAgent):
             PathTraversalError: If path traversal is detected
         """
         # Resolve both paths to absolute paths
-        resolved_base = base_path.resolve()
+        if resolved_base is None:
+            resolved_base = base_path.resolve()
         resolved_file = (base_path / file_path).resolve()
 
         # Check that the resolved file path starts with the base path
@@ -204,6 +212,7 @@ class ExecutorAgent(BaseAgent):
     ) -> dict[str, Any]:
         """Write generated files to the filesystem with path traversal protection."""
         errors = []
+        resolved_base = base_path.resolve()
 
         for file_info in files:
             relative_path = file_info.get("path", "")
@@ -211,7 +220,9 @@ class ExecutorAgent(BaseAgent):
 
             try:
                 # Validate path is safe (prevents path traversal attacks)
-                file_path = self._validate_path(Path(relative_path), base_path)
+                file_path = self._validate_path(
+                    Path(relative_path), base_path, resolved_base
+                )
 
                 # Create parent directories
                 file_path.parent.mkdir(parents=True, exist_ok=True)
@@ -8,7 +8,11 @@ from typing import Any, Generator, Optional
 from pydantic import BaseModel, Field, SecretStr
 
 # Import SQL identifier validation using canonical path
-from src.parser.utils import SQLIdentifierError, validate_sql_identifier
+from src.parser.utils import (
+    SQLIdentifierError,
+    validate_sql_identifier,
+    validate_sql_identifiers,
+)
 
 try:
     import pyodbc
@@ -185,8 +189,9 @@ class SQLServerConnection:
         """
         self._validate_identifier(table, "table name")
         self._validate_identifier(schema, "schema name")
-        for col in columns:
-            self._validate_identifier(col, "column name")
+        invalid_columns = validate_sql_identifiers(columns)
+        if invalid_columns:
+            raise SQLIdentifierError(invalid_columns[0], "Invalid SQL column name")
 
         checksums: dict[str, float] = {}
 
@@ -1,5 +1,18 @@
 """SSIS Package Parser Module."""
 
-from .ssis_parser import SSISParser
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .ssis_parser import SSISParser
 
 __all__ = ["SSISParser"]
+
+
+def __getattr__(name: str):
+    # Import the parser (lxml, rich) only when it is used, so importing
+    # src.parser.utils or src.parser.models stays lightweight
+    if name == "SSISParser":
+        from .ssis_parser import SSISParser
+
+        return SSISParser
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
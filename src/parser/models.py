@@ -3,7 +3,7 @@
 from enum import Enum
 from typing import Any, Optional
 
-from pydantic import BaseModel, Field, field_serializer
+from pydantic import BaseModel, ConfigDict, Field, field_serializer
 
 from .utils import redact_connection_string
 
@@ -21,7 +21,18 @@ class TaskType(str, Enum):
     UNKNOWN = "Unknown"
 
 
-class ColumnInfo(BaseModel):
+class _ValueModel(BaseModel):
+    """
+    Base for immutable leaf models.
+
+    Instances are never modified after parsing, so they are frozen, and
+    unknown fields are rejected rather than silently dropped.
+    """
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+
+class ColumnInfo(_ValueModel):
     """Column metadata from data flow components."""
 
     name: str
@@ -50,7 +61,7 @@ class ConnectionManager(BaseModel):
         return redact_connection_string(v)
 
 
-class Variable(BaseModel):
+class Variable(_ValueModel):
     """SSIS Package Variable."""
 
     namespace: str
@@ -85,7 +96,7 @@ class LookupTransform(BaseModel):
     output_columns: list[str] = Field(default_factory=list)
 
 
-class DataFlowSource(BaseModel):
+class DataFlowSource(_ValueModel):
     """Data Flow source component (OLE DB Source, Flat File, etc.)."""
 
     name: str
@@ -155,7 +166,7 @@ class SendMailTask(BaseModel):
     skip_reason: str = "Send Mail Tasks are not converted - handle notifications externally"
 
 
-class PrecedenceConstraint(BaseModel):
+class PrecedenceConstraint(_ValueModel):
     """Precedence constraint defining task execution order."""
 
     from_task: str
@@ -202,7 +213,7 @@ class SSISPackage(BaseModel):
 
     def has_manual_review_items(self) -> bool:
         """Check if package contains items requiring manual review."""
-        return len(self.script_tasks) > 0
+        return bool(self.script_tasks)
 
 
 class SchemaTable(BaseModel):
@@ -5,35 +5,31 @@ This module parses SQL Server Integration Services (SSIS) package files
 and extracts connection managers, variables, tasks, and data flow components.
 """
 
-import json
+import io
 import logging
 import os
 import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
+from typing import Sequence
 
 from lxml import etree
+from pydantic import TypeAdapter
 from rich.console import Console
-from rich.table import Table
 
 logger = logging.getLogger(__name__)
 
-# Secure XML parser configuration to prevent XXE attacks
-def _create_secure_parser() -> etree.XMLParser:
-    """
-    Create a secure XML parser with external entity processing disabled.
-
-    This prevents XXE (XML External Entity) attacks that could:
-    - Read arbitrary files from the filesystem
-    - Perform SSRF (Server-Side Request Forgery) attacks
-    - Cause denial of service via entity expansion (Billion Laughs attack)
-    """
-    return etree.XMLParser(
-        resolve_entities=False,
-        no_network=True,
-        dtd_validation=False,
-        load_dtd=False,
-    )
+# Secure XML parser settings passed to iterparse, preventing XXE attacks that
+# could read local files, make network requests (SSRF) or expand entities
+# without bound (Billion Laughs)
+_SECURE_PARSER_OPTIONS = {
+    "resolve_entities": False,
+    "no_network": True,
+    "dtd_validation": False,
+    "load_dtd": False,
+}
 
 from .constants import MANUAL_REVIEW_TASKS, NAMESPACES, VARIABLE_DATA_TYPES
 from .models import (
@@ -59,6 +55,16 @@ from .type_mappings import map_ssis_type_to_sql
 
 console = Console()
 
+# Serializes the package list directly to JSON without an intermediate dict
+_PACKAGE_LIST_ADAPTER = TypeAdapter(list[SSISPackage])
+
+
+def _parse_package_in_worker(file_path: str) -> tuple[SSISPackage, SchemaMetadata]:
+    """Parse one package in a worker process with a fresh parser."""
+    parser = SSISParser()
+    package = parser.parse_package(file_path)
+    return package, parser.schema_metadata
+
 
 class SSISParser:
     """Parser for SSIS .dtsx package files."""
@@ -109,10 +115,59 @@ class SSISParser:
 
         return self.packages
 
+    def parse_packages(
+        self,
+        paths: Sequence[str | Path],
+        max_workers: int | None = None,
+    ) -> list[SSISPackage]:
+        """
+        Parse many SSIS package files in parallel worker processes.
+
+        Packages and schema metadata are collected in the order of `paths`,
+        so the result matches parsing the files one by one. Files that fail
+        to parse are logged and skipped, as in parse_directory.
+
+        Args:
+            paths: Paths to the .dtsx files
+            max_workers: Worker process count (defaults to the CPU count)
+
+        Returns:
+            List of successfully parsed SSISPackage objects
+        """
+        parsed: list[SSISPackage] = []
+        if not paths:
+            return parsed
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(_parse_package_in_worker, str(path)) for path in paths
+            ]
+            for path, future in zip(paths, futures):
+                try:
+                    package, metadata = future.result()
+                except Exception as e:
+                    logger.error(f"Error parsing {path}: {e}", exc_info=True)
+                    console.print(f"[red]✗ Error parsing {path}: {e}[/red]")
+                    continue
+
+                self._merge_schema_metadata(metadata)
+                self.packages.append(package)
+                parsed.append(package)
+                logger.info(f"Successfully parsed: {package.name}")
+                if self.verbose:
+                    console.print(f"[green]✓ Parsed: {package.name}[/green]")
+
+        return parsed
+
     def parse_package(self, file_path: str | Path) -> SSISPackage:
         """
         Parse a single SSIS package file.
 
+        The file is streamed with iterparse: each connection manager,
+        variable, executable and precedence constraint is extracted when its
+        end tag is reached and then cleared, so resident memory tracks the
+        largest single element rather than the whole document.
+
         Args:
             file_path: Path to the .dtsx file
 
@@ -120,15 +175,59 @@ class SSISParser:
             Parsed SSISPackage object
         """
         file_path = Path(file_path)
-        # Use secure parser to prevent XXE attacks
-        secure_parser = _create_secure_parser()
-        tree = etree.parse(str(file_path), parser=secure_parser)
-        root = tree.getroot()
+        ns = NAMESPACES["DTS"]
+        cm_tag = f"{{{ns}}}ConnectionManager"
+        var_tag = f"{{{ns}}}Variable"
+        exec_tag = f"{{{ns}}}Executable"
+        constraint_tag = f"{{{ns}}}PrecedenceConstraint"
+
+        # Use secure parser settings to prevent XXE attacks
+        context = etree.iterparse(
+            str(file_path),
+            events=("end",),
+            tag=(cm_tag, var_tag, exec_tag, constraint_tag),
+            **_SECURE_PARSER_OPTIONS,
+        )
+
+        package = None
+        for _, elem in context:
+            if package is None:
+                package = self._create_package(elem.getroottree().getroot(), file_path)
+
+            tag = elem.tag
+            if tag == exec_tag:
+                # The package itself is the root executable
+                if elem.getparent() is None:
+                    continue
+                self._parse_executable(elem, package)
+                # Drop already-parsed sibling executables as well
+                parent = elem.getparent()
+                while (prev := elem.getprevious()) is not None and prev.tag == exec_tag:
+                    parent.remove(prev)
+            elif tag == cm_tag:
+                # Nested ConnectionManager elements are parsed with their outer one
+                if next(elem.iterancestors(cm_tag), None) is not None:
+                    continue
+                package.connection_managers.extend(
+                    self._parse_connection_manager(cm) for cm in elem.iter(cm_tag)
+                )
+            elif tag == var_tag:
+                package.variables.append(self._parse_variable(elem))
+            else:
+                package.precedence_constraints.append(
+                    self._parse_precedence_constraint(elem)
+                )
+            elem.clear(keep_tail=True)
 
+        if package is None:
+            package = self._create_package(context.root, file_path)
+        return package
+
+    def _create_package(self, root: etree._Element, file_path: Path) -> SSISPackage:
+        """Create an SSISPackage from the package root element's metadata."""
         ns = NAMESPACES["DTS"]
 
-        # Extract package metadata
-        package = SSISPackage(
+        return SSISPackage(
             name=root.get(f"{{{ns}}}ObjectName", file_path.stem),
             description=root.get(f"{{{ns}}}Description"),
             creation_date=root.get(f"{{{ns}}}CreationDate"),
@@ -138,111 +237,86 @@ class SSISParser:
             file_size_bytes=file_path.stat().st_size,
         )
 
-        # Parse components
-        package.connection_managers = self._parse_connection_managers(root)
-        package.variables = self._parse_variables(root)
-
-        # Parse executables (tasks)
-        self._parse_executables(root, package)
-
-        # Parse precedence constraints
-        package.precedence_constraints = self._parse_precedence_constraints(root)
-
-        return package
-
-    def _parse_connection_managers(
-        self, root: etree._Element
-    ) -> list[ConnectionManager]:
-        """Extract connection managers from package."""
-        managers = []
+    def _parse_connection_manager(self, cm: etree._Element) -> ConnectionManager:
+        """Extract a connection manager."""
         ns = NAMESPACES["DTS"]
 
-        for cm in root.findall(f".//{{{ns}}}ConnectionManager"):
-            conn_str = ""
-            obj_data = cm.find(f"{{{ns}}}ObjectData/{{{ns}}}ConnectionManager")
-            if obj_data is not None:
-                conn_str = obj_data.get(f"{{{ns}}}ConnectionString", "")
-
-            manager = ConnectionManager(
-                id=cm.get(f"{{{ns}}}DTSID", ""),
-                name=cm.get(f"{{{ns}}}ObjectName", ""),
-                description=cm.get(f"{{{ns}}}Description"),
-                connection_string=conn_str,
-                server=self._extract_server_from_conn_string(conn_str),
-                database=self._extract_database_from_conn_string(conn_str),
-                provider=self._extract_provider_from_conn_string(conn_str),
-            )
-            managers.append(manager)
-
-        return managers
+        conn_str = ""
+        obj_data = cm.find(f"{{{ns}}}ObjectData/{{{ns}}}ConnectionManager")
+        if obj_data is not None:
+            conn_str = obj_data.get(f"{{{ns}}}ConnectionString", "")
+
+        return ConnectionManager(
+            id=cm.get(f"{{{ns}}}DTSID", ""),
+            name=cm.get(f"{{{ns}}}ObjectName", ""),
+            description=cm.get(f"{{{ns}}}Description"),
+            connection_string=conn_str,
+            server=self._extract_server_from_conn_string(conn_str),
+            database=self._extract_database_from_conn_string(conn_str),
+            provider=self._extract_provider_from_conn_string(conn_str),
+        )
 
-    def _parse_variables(self, root: etree._Element) -> list[Variable]:
-        """Extract variables from package."""
-        variables = []
+    def _parse_variable(self, var: etree._Element) -> Variable:
+        """Extract a package or task variable."""
         ns = NAMESPACES["DTS"]
 
-        for var in root.findall(f".//{{{ns}}}Variable"):
-            value_elem = var.find(f"{{{ns}}}VariableValue")
-            value = value_elem.text if value_elem is not None else None
-            data_type_code = (
-                value_elem.get(f"{{{ns}}}DataType", "8")
-                if value_elem is not None
-                else "8"
-            )
-
-            variable = Variable(
-                namespace=var.get(f"{{{ns}}}Namespace", "User"),
-                name=var.get(f"{{{ns}}}ObjectName", ""),
-                data_type=VARIABLE_DATA_TYPES.get(data_type_code, "DT_WSTR"),
-                value=value,
-                expression=var.get(f"{{{ns}}}Expression"),
-                description=var.get(f"{{{ns}}}Description"),
-            )
-            variables.append(variable)
+        value_elem = var.find(f"{{{ns}}}VariableValue")
+        value = value_elem.text if value_elem is not None else None
+        data_type_code = (
+            value_elem.get(f"{{{ns}}}DataType", "8")
+            if value_elem is not None
+            else "8"
+        )
 
-        return variables
+        return Variable(
+            namespace=var.get(f"{{{ns}}}Namespace", "User"),
+            name=var.get(f"{{{ns}}}ObjectName", ""),
+            data_type=VARIABLE_DATA_TYPES.get(data_type_code, "DT_WSTR"),
+            value=value,
+            expression=var.get(f"{{{ns}}}Expression"),
+            description=var.get(f"{{{ns}}}Description"),
+        )
 
-    def _parse_executables(
-        self, root: etree._Element, package: SSISPackage
+    def _parse_executable(
+        self, executable: etree._Element, package: SSISPackage
     ) -> None:
-        """Parse all executable elements (tasks and containers)."""
+        """Parse an executable element (task or container) into the package."""
         ns = NAMESPACES["DTS"]
 
-        for executable in root.findall(f".//{{{ns}}}Executable"):
-            exec_type = executable.get(f"{{{ns}}}ExecutableType", "")
-            task_name = executable.get(f"{{{ns}}}ObjectName", "")
-
-            if exec_type == "Microsoft.ExecuteSQLTask":
-                task = self._parse_execute_sql_task(executable)
-                if task:
-                    package.execute_sql_tasks.append(task)
-
-            elif exec_type == "Microsoft.Pipeline":
-                task = self._parse_data_flow_task(executable)
-                if task:
-                    package.data_flow_tasks.append(task)
-
-            elif exec_type == "Microsoft.ScriptTask":
-                task = self._parse_script_task(executable)
-                if task:
-                    package.script_tasks.append(task)
-                    package.parsing_warnings.append(
-                        f"Script Task '{task.name}' flagged for manual review"
-                    )
+        exec_type = executable.get(f"{{{ns}}}ExecutableType", "")
+        task_name = executable.get(f"{{{ns}}}ObjectName", "")
 
-            elif exec_type == "Microsoft.SendMailTask":
-                task = self._parse_send_mail_task(executable)
-                if task:
-                    package.send_mail_tasks.append(task)
-                    package.parsing_warnings.append(
-                        f"Send Mail Task '{task.name}' will not be converted"
-                    )
+        if exec_type == "Microsoft.ExecuteSQLTask":
+            task = self._parse_execute_sql_task(executable)
+            if task:
+                package.execute_sql_tasks.append(task)
 
-            elif exec_type in MANUAL_REVIEW_TASKS:
+        elif exec_type == "Microsoft.Pipeline":
+            task = self._parse_data_flow_task(executable)
+            if task:
+                package.data_flow_tasks.append(task)
+
+        elif exec_type == "Microsoft.ScriptTask":
+            task = self._parse_script_task(executable)
+            if task:
+                package.script_tasks.append(task)
                 package.parsing_warnings.append(
-                    f"Task '{task_name}' ({exec_type}) flagged: {MANUAL_REVIEW_TASKS[exec_type]}"
+                    f"Script Task '{task.name}' flagged for manual review"
                 )
 
+        elif exec_type == "Microsoft.SendMailTask":
+            task = self._parse_send_mail_task(executable)
+            if task:
+                package.send_mail_tasks.append(task)
+                package.parsing_warnings.append(
+                    f"Send Mail Task '{task.name}' will not be converted"
+                )
+
+        elif exec_type in MANUAL_REVIEW_TASKS:
+            package.parsing_warnings.append(
+                f"Task '{task_name}' ({exec_type}) flagged: {MANUAL_REVIEW_TASKS[exec_type]}"
+            )
+
     def _parse_execute_sql_task(
         self, executable: etree._Element
     ) -> ExecuteSQLTask | None:
@@ -254,7 +328,8 @@ class SSISParser:
         if sql_data is None:
             return None
 
-        return ExecuteSQLTask(
+        # Attribute values are plain strings, so field validation can be skipped
+        return ExecuteSQLTask.model_construct(
             name=executable.get(f"{{{ns_dts}}}ObjectName", ""),
             description=executable.get(f"{{{ns_dts}}}Description"),
             connection_manager=sql_data.get(f"{{{ns_sql}}}Connection", ""),
@@ -315,25 +390,31 @@ class SSISParser:
             elif prop_name == "OpenRowset":
                 table_name = prop.text
 
-        # Extract column metadata
+        # Extract column metadata (values are already typed, so skip validation)
         columns = []
         for col in component.findall(".//outputColumn"):
+            # A package uses a handful of type names across all its columns, so
+            # intern them to share one string and speed the type-map lookups
+            ssis_type = sys.intern(col.get("dataType", "wstr"))
             length = col.get("length")
             precision = col.get("precision")
             scale = col.get("scale")
+            length = int(length) if length else None
+            precision = int(precision) if precision else None
+            scale = int(scale) if scale else None
 
-            col_info = ColumnInfo(
+            col_info = ColumnInfo.model_construct(
                 name=col.get("name", ""),
-                ssis_type=col.get("dataType", "wstr"),
+                ssis_type=ssis_type,
                 sql_type=map_ssis_type_to_sql(
-                    col.get("dataType", "wstr"),
-                    length=int(length) if length else None,
-                    precision=int(precision) if precision else None,
-                    scale=int(scale) if scale else None,
+                    ssis_type,
+                    length=length,
+                    precision=precision,
+                    scale=scale,
                 ),
-                length=int(length) if length else None,
-                precision=int(precision) if precision else None,
-                scale=int(scale) if scale else None,
+                length=length,
+                precision=precision,
+                scale=scale,
             )
             columns.append(col_info)
 
@@ -343,7 +424,7 @@ class SSISParser:
         if conn_elem is not None:
             conn_ref = conn_elem.get("connectionManagerRefId", "")
 
-        return DataFlowSource(
+        return DataFlowSource.model_construct(
             name=component.get("name", ""),
             component_type="OLEDBSource",
             description=component.get("description"),
@@ -504,30 +585,24 @@ class SSISParser:
             message_source=message,
         )
 
-    def _parse_precedence_constraints(
-        self, root: etree._Element
-    ) -> list[PrecedenceConstraint]:
-        """Parse precedence constraints (task execution order)."""
-        constraints = []
+    def _parse_precedence_constraint(
+        self, constraint: etree._Element
+    ) -> PrecedenceConstraint:
+        """Parse a precedence constraint (task execution order)."""
         ns = NAMESPACES["DTS"]
 
-        for constraint in root.findall(f".//{{{ns}}}PrecedenceConstraint"):
-            from_task = constraint.get(f"{{{ns}}}From", "")
-            to_task = constraint.get(f"{{{ns}}}To", "")
-
-            # Clean up task paths (remove "Package\" prefix)
-            from_task = from_task.replace("Package\\", "")
-            to_task = to_task.replace("Package\\", "")
+        from_task = constraint.get(f"{{{ns}}}From", "")
+        to_task = constraint.get(f"{{{ns}}}To", "")
 
-            constraints.append(
-                PrecedenceConstraint(
-                    from_task=from_task,
-                    to_task=to_task,
-                    constraint_type="Success",
-                )
-            )
+        # Clean up task paths (remove "Package\" prefix)
+        from_task = from_task.replace("Package\\", "")
+        to_task = to_task.replace("Package\\", "")
 
-        return constraints
+        return PrecedenceConstraint(
+            from_task=from_task,
+            to_task=to_task,
+            constraint_type="Success",
+        )
 
     def _add_table_to_metadata(
         self, table_name: str | None, columns: list[ColumnInfo], task_name: str
@@ -579,6 +654,26 @@ class SSISParser:
                 )
             )
 
+    def _merge_schema_metadata(self, metadata: SchemaMetadata) -> None:
+        """
+        Merge schema metadata collected by another parser into this one.
+
+        Gives the same tables, references and columns as if the other
+        parser's packages had been parsed here directly.
+        """
+        for table in metadata.tables:
+            if table.full_name not in self._tables_seen:
+                self._tables_seen.add(table.full_name)
+                self.schema_metadata.tables.append(table)
+                continue
+            for tbl in self.schema_metadata.tables:
+                if tbl.full_name == table.full_name:
+                    for task_name in table.referenced_in:
+                        if task_name not in tbl.referenced_in:
+                            tbl.referenced_in.append(task_name)
+
+        self.schema_metadata.columns.extend(metadata.columns)
+
     # Helper methods for connection string parsing
     def _extract_server_from_conn_string(self, conn_str: str) -> str | None:
         """Extract server name from connection string."""
@@ -623,17 +718,15 @@ class SSISParser:
         output_dir.mkdir(parents=True, exist_ok=True)
 
         # Export parsed_packages.json
-        packages_data = [pkg.model_dump() for pkg in self.packages]
-        with open(output_dir / "parsed_packages.json", "w") as f:
-            json.dump(packages_data, f, indent=2, default=str)
+        with open(output_dir / "parsed_packages.json", "wb") as f:
+            f.write(_PACKAGE_LIST_ADAPTER.dump_json(self.packages, indent=2))
 
         if self.verbose:
             console.print(f"[green]✓ Exported parsed_packages.json[/green]")
 
         # Export schema_metadata.json
-        schema_data = self.schema_metadata.model_dump()
-        with open(output_dir / "schema_metadata.json", "w") as f:
-            json.dump(schema_data, f, indent=2)
+        with open(output_dir / "schema_metadata.json", "w", encoding="utf-8") as f:
+            f.write(self.schema_metadata.model_dump_json(indent=2))
 
         if self.verbose:
             console.print(f"[green]✓ Exported schema_metadata.json[/green]")
@@ -645,101 +738,82 @@ class SSISParser:
 
         result = self.get_parsing_result()
 
-        report_lines = [
-            "# SSIS Package Parsing Report",
-            "",
-            f"**Generated**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-            "",
-            "## Summary",
-            "",
-            f"| Metric | Count |",
-            f"|--------|-------|",
-            f"| Total Packages Parsed | {result.total_packages} |",
-            f"| Execute SQL Tasks | {result.total_execute_sql_tasks} |",
-            f"| Data Flow Tasks | {result.total_data_flow_tasks} |",
-            f"| Script Tasks (Manual Review) | {result.total_script_tasks} |",
-            f"| Tables Referenced | {len(self.schema_metadata.tables)} |",
-            f"| Total Warnings | {result.total_warnings} |",
-            "",
-        ]
+        # Accumulate into a single growing buffer; each section opens with its
+        # own blank separator line so no trailing newline needs trimming.
+        buf = io.StringIO()
+        w = buf.write
+
+        w("# SSIS Package Parsing Report\n\n")
+        w(f"**Generated**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+        w("## Summary\n\n")
+        w("| Metric | Count |\n")
+        w("|--------|-------|\n")
+        w(f"| Total Packages Parsed | {result.total_packages} |\n")
+        w(f"| Execute SQL Tasks | {result.total_execute_sql_tasks} |\n")
+        w(f"| Data Flow Tasks | {result.total_data_flow_tasks} |\n")
+        w(f"| Script Tasks (Manual Review) | {result.total_script_tasks} |\n")
+        w(f"| Tables Referenced | {len(self.schema_metadata.tables)} |\n")
+        w(f"| Total Warnings | {result.total_warnings} |\n")
 
         # Package details
-        report_lines.append("## Package Details")
-        report_lines.append("")
+        w("\n## Package Details\n")
 
         for pkg in self.packages:
             size_kb = pkg.file_size_bytes / 1024
-            report_lines.extend(
-                [
-                    f"### {pkg.name}",
-                    "",
-                    f"- **File**: `{os.path.basename(pkg.file_path)}`",
-                    f"- **Size**: {size_kb:.1f} KB",
-                    f"- **Description**: {pkg.description or 'N/A'}",
-                    f"- **Creator**: {pkg.creator_name or 'N/A'}",
-                    f"- **Created**: {pkg.creation_date or 'N/A'}",
-                    "",
-                    "#### Components",
-                    "",
-                    f"| Component Type | Count |",
-                    f"|----------------|-------|",
-                    f"| Connection Managers | {len(pkg.connection_managers)} |",
-                    f"| Variables | {len(pkg.variables)} |",
-                    f"| Execute SQL Tasks | {len(pkg.execute_sql_tasks)} |",
-                    f"| Data Flow Tasks | {len(pkg.data_flow_tasks)} |",
-                    f"| Script Tasks | {len(pkg.script_tasks)} |",
-                    f"| Send Mail Tasks | {len(pkg.send_mail_tasks)} |",
-                    "",
-                ]
-            )
+            w(f"\n### {pkg.name}\n\n")
+            w(f"- **File**: `{os.path.basename(pkg.file_path)}`\n")
+            w(f"- **Size**: {size_kb:.1f} KB\n")
+            w(f"- **Description**: {pkg.description or 'N/A'}\n")
+            w(f"- **Creator**: {pkg.creator_name or 'N/A'}\n")
+            w(f"- **Created**: {pkg.creation_date or 'N/A'}\n\n")
+            w("#### Components\n\n")
+            w("| Component Type | Count |\n")
+            w("|----------------|-------|\n")
+            w(f"| Connection Managers | {len(pkg.connection_managers)} |\n")
+            w(f"| Variables | {len(pkg.variables)} |\n")
+            w(f"| Execute SQL Tasks | {len(pkg.execute_sql_tasks)} |\n")
+            w(f"| Data Flow Tasks | {len(pkg.data_flow_tasks)} |\n")
+            w(f"| Script Tasks | {len(pkg.script_tasks)} |\n")
+            w(f"| Send Mail Tasks | {len(pkg.send_mail_tasks)} |\n")
 
             # Connection managers
             if pkg.connection_managers:
-                report_lines.append("#### Connection Managers")
-                report_lines.append("")
+                w("\n#### Connection Managers\n\n")
                 for cm in pkg.connection_managers:
-                    report_lines.append(
-                        f"- **{cm.name}**: `{cm.server or 'N/A'}` / `{cm.database or 'N/A'}`"
-                    )
-                report_lines.append("")
+                    w(f"- **{cm.name}**: `{cm.server or 'N/A'}` / `{cm.database or 'N/A'}`\n")
 
             # Warnings
             if pkg.parsing_warnings:
-                report_lines.append("#### Warnings")
-                report_lines.append("")
+                w("\n#### Warnings\n\n")
                 for warning in pkg.parsing_warnings:
-                    report_lines.append(f"- ⚠️ {warning}")
-                report_lines.append("")
+                    w(f"- ⚠️ {warning}\n")
 
             # Task execution order
             if pkg.precedence_constraints:
-                report_lines.append("#### Execution Order")
-                report_lines.append("")
-                report_lines.append("```")
+                w("\n#### Execution Order\n\n```\n")
                 for pc in pkg.precedence_constraints:
-                    report_lines.append(f"{pc.from_task} → {pc.to_task}")
-                report_lines.append("```")
-                report_lines.append("")
+                    w(f"{pc.from_task} → {pc.to_task}\n")
+                w("```\n")
 
         # Schema summary
         if self.schema_metadata.tables:
-            report_lines.append("## Tables Referenced")
-            report_lines.append("")
-            report_lines.append("| Table | Referenced In |")
-            report_lines.append("|-------|---------------|")
+            w("\n## Tables Referenced\n\n")
+            w("| Table | Referenced In |\n")
+            w("|-------|---------------|\n")
             for tbl in self.schema_metadata.tables:
                 refs = ", ".join(tbl.referenced_in)
-                report_lines.append(f"| `{tbl.full_name}` | {refs} |")
-            report_lines.append("")
+                w(f"| `{tbl.full_name}` | {refs} |\n")
 
         with open(output_dir / "parsing_report.md", "w") as f:
-            f.write("\n".join(report_lines))
+            f.write(buf.getvalue())
 
         if self.verbose:
             console.print(f"[green]✓ Generated parsing_report.md[/green]")
 
     def print_summary(self) -> None:
         """Print a summary table to the console."""
+        from rich.table import Table
+
         result = self.get_parsing_result()
 
         table = Table(title="SSIS Parsing Summary")
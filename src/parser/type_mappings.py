@@ -1,6 +1,14 @@
 """SSIS to SQL Server data type mappings."""
 
-from .utils import SQLIdentifierError, sanitize_sql_identifier, validate_sql_identifier
+import re
+from functools import lru_cache
+
+from .utils import (
+    SQL_TYPE_PATTERN,
+    SQLIdentifierError,
+    sanitize_sql_identifier,
+    validate_sql_identifier,
+)
 
 # SSIS to SQL Server type mapping
 # Based on Microsoft Integration Services Data Types documentation
@@ -61,7 +69,21 @@ SSIS_TO_SQL_TYPE_MAP = {
     "cy": "MONEY",
 }
 
+# Case-folded view of SSIS_TO_SQL_TYPE_MAP so "DT_WSTR", "dt_wstr" and "wstr"
+# style spellings all resolve with a single dict lookup
+_CASEFOLDED_TYPE_MAP = {k.casefold(): v for k, v in SSIS_TO_SQL_TYPE_MAP.items()}
+
+# SSIS types (case-folded) whose SQL type takes size parameters
+_STRING_TYPES = frozenset({"dt_wstr", "dt_str", "wstr", "str"})
+_NUMERIC_TYPES = frozenset({"dt_decimal", "dt_numeric", "numeric"})
+_BINARY_TYPES = frozenset({"dt_bytes", "bytes"})
+
+# snake_case word-boundary patterns used by get_snake_case
+_CAMEL_WORD_PATTERN = re.compile(r"(.)([A-Z][a-z]+)")
+_LOWER_UPPER_PATTERN = re.compile(r"([a-z0-9])([A-Z])")
 
+
+@lru_cache(maxsize=1024)
 def map_ssis_type_to_sql(
     ssis_type: str,
     length: int | None = None,
@@ -79,26 +101,35 @@ def map_ssis_type_to_sql(
 
     Returns:
         SQL Server data type string (e.g., 'NVARCHAR(50)', 'NUMERIC(18,2)')
+
+    Type names are matched case-insensitively. Results are memoized, since the
+    same handful of column types repeats throughout a package.
     """
-    base_type = SSIS_TO_SQL_TYPE_MAP.get(ssis_type, "NVARCHAR(MAX)")
+    # Parsed columns can lack a dataType; fall back like any unknown type
+    if not isinstance(ssis_type, str):
+        return "NVARCHAR(MAX)"
+
+    key = ssis_type.casefold()
+    base_type = _CASEFOLDED_TYPE_MAP.get(key, "NVARCHAR(MAX)")
 
     # Handle string types with length
-    if ssis_type in ("DT_WSTR", "DT_STR", "wstr", "str") and length:
+    if length and key in _STRING_TYPES:
         return f"{base_type}({length})"
 
     # Handle numeric types with precision and scale
-    if ssis_type in ("DT_DECIMAL", "DT_NUMERIC", "numeric") and precision:
+    if precision and key in _NUMERIC_TYPES:
         if scale is not None:
             return f"NUMERIC({precision},{scale})"
         return f"NUMERIC({precision})"
 
     # Handle binary types with length
-    if ssis_type in ("DT_BYTES", "bytes") and length:
+    if length and key in _BINARY_TYPES:
         return f"VARBINARY({length})"
 
     return base_type
 
 
+@lru_cache(maxsize=2048)
 def get_dbt_cast_expression(
     column_name: str,
     ssis_type: str,
@@ -119,6 +150,9 @@ def get_dbt_cast_expression(
 
     Raises:
         SQLIdentifierError: If column_name is not a valid SQL identifier and strict=True.
+
+    Results are memoized; the same casts recur across staging, intermediate and
+    mart models. Invalid inputs raise on every call, since exceptions are not cached.
     """
     # Validate column name to prevent SQL injection
     if not validate_sql_identifier(column_name):
@@ -130,28 +164,31 @@ def get_dbt_cast_expression(
         # In non-strict mode, sanitize the identifier
         column_name = sanitize_sql_identifier(column_name)
 
-    # Validate SQL type (should only contain safe characters)
-    if not validate_sql_identifier(sql_type.split('(')[0]):
+    # Validate the whole SQL type, including any size suffix
+    type_match = SQL_TYPE_PATTERN.fullmatch(sql_type)
+    if type_match is None or not validate_sql_identifier(type_match.group(1)):
         raise SQLIdentifierError(sql_type, "Invalid SQL type")
 
     # For most types, a simple CAST is sufficient
     return f"CAST({column_name} AS {sql_type})"
 
 
+@lru_cache(maxsize=4096)
 def get_snake_case(name: str) -> str:
     """
     Convert a column name to snake_case.
 
+    Results are memoized, as the same column and table names recur across
+    packages and model layers.
+
     Args:
         name: The original column name (e.g., 'CustomerID', 'FirstName')
 
     Returns:
         Snake case version (e.g., 'customer_id', 'first_name')
     """
-    import re
-
     # Insert underscore before uppercase letters (except at start)
-    s1 = re.sub("(.)([A-Z][a-z]+)", r"\1_\2", name)
+    s1 = _CAMEL_WORD_PATTERN.sub(r"\1_\2", name)
     # Insert underscore before uppercase letters followed by lowercase
-    s2 = re.sub("([a-z0-9])([A-Z])", r"\1_\2", s1)
+    s2 = _LOWER_UPPER_PATTERN.sub(r"\1_\2", s1)
     return s2.lower()
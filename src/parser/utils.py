@@ -1,36 +1,81 @@
 """Utility functions for SSIS parser."""
 
+import os
 import re
-from typing import Any
+import sys
+from functools import lru_cache
+from typing import Any, Iterable, Optional
 
 
 # SECURITY: Patterns for credentials in connection strings
-# These patterns handle various formats including quoted values and special characters
+# These patterns handle various formats including quoted values and special characters.
+# Each entry is tagged with the credential key it redacts (see _CREDENTIAL_KEY_SCAN).
 CREDENTIAL_PATTERNS = [
     # Handle quoted passwords: Password="secret;value"
-    (re.compile(r'(Password\s*=\s*)"([^"]*)"', re.IGNORECASE), r'\1"***REDACTED***"'),
-    (re.compile(r"(Password\s*=\s*)'([^']*)'", re.IGNORECASE), r"\1'***REDACTED***'"),
+    # These also cover "User Password=...", whose "Password" suffix matches.
+    ('password', re.compile(r'(Password\s*=\s*)"([^"]*)"', re.IGNORECASE), r'\1"***REDACTED***"'),
+    ('password', re.compile(r"(Password\s*=\s*)'([^']*)'", re.IGNORECASE), r"\1'***REDACTED***'"),
     # Handle unquoted passwords (stop at semicolon or end of string)
-    (re.compile(r'(Password\s*=\s*)([^;"\'\s][^;]*)', re.IGNORECASE), r'\1***REDACTED***'),
+    ('password', re.compile(r'(Password\s*=\s*)([^;"\'\s][^;]*)', re.IGNORECASE), r'\1***REDACTED***'),
     # PWD variants
-    (re.compile(r'(PWD\s*=\s*)"([^"]*)"', re.IGNORECASE), r'\1"***REDACTED***"'),
-    (re.compile(r"(PWD\s*=\s*)'([^']*)'", re.IGNORECASE), r"\1'***REDACTED***'"),
-    (re.compile(r'(PWD\s*=\s*)([^;"\'\s][^;]*)', re.IGNORECASE), r'\1***REDACTED***'),
-    # User Password
-    (re.compile(r'(User Password\s*=\s*)"([^"]*)"', re.IGNORECASE), r'\1"***REDACTED***"'),
-    (re.compile(r"(User Password\s*=\s*)'([^']*)'", re.IGNORECASE), r"\1'***REDACTED***'"),
-    (re.compile(r'(User Password\s*=\s*)([^;"\'\s][^;]*)', re.IGNORECASE), r'\1***REDACTED***'),
+    ('pwd', re.compile(r'(PWD\s*=\s*)"([^"]*)"', re.IGNORECASE), r'\1"***REDACTED***"'),
+    ('pwd', re.compile(r"(PWD\s*=\s*)'([^']*)'", re.IGNORECASE), r"\1'***REDACTED***'"),
+    ('pwd', re.compile(r'(PWD\s*=\s*)([^;"\'\s][^;]*)', re.IGNORECASE), r'\1***REDACTED***'),
     # Secret/API Key
-    (re.compile(r'(Secret\s*=\s*)([^;]+)', re.IGNORECASE), r'\1***REDACTED***'),
-    (re.compile(r'(API[_-]?Key\s*=\s*)([^;]+)', re.IGNORECASE), r'\1***REDACTED***'),
-    (re.compile(r'(Token\s*=\s*)([^;]+)', re.IGNORECASE), r'\1***REDACTED***'),
-    (re.compile(r'(Bearer\s+)([^\s;]+)', re.IGNORECASE), r'\1***REDACTED***'),
+    ('secret', re.compile(r'(Secret\s*=\s*)([^;]+)', re.IGNORECASE), r'\1***REDACTED***'),
+    ('api_key', re.compile(r'(API[_-]?Key\s*=\s*)([^;]+)', re.IGNORECASE), r'\1***REDACTED***'),
+    ('token', re.compile(r'(Token\s*=\s*)([^;]+)', re.IGNORECASE), r'\1***REDACTED***'),
+    ('bearer', re.compile(r'(Bearer\s+)([^\s;]+)', re.IGNORECASE), r'\1***REDACTED***'),
 ]
 
+# Single pass over a connection string reporting which credential keys occur
+# anywhere in it. The lookahead makes matches zero-width, so overlapping keys
+# ("secretoken") are all found. Keys absent from the input cannot be introduced
+# by a redaction, so patterns for them are skipped without changing the result.
+_CREDENTIAL_KEY_SCAN = re.compile(
+    r'(?=(?P<password>Password)|(?P<pwd>PWD)|(?P<secret>Secret)'
+    r'|(?P<api_key>API[_-]?Key)|(?P<token>Token)|(?P<bearer>Bearer))',
+    re.IGNORECASE,
+)
+
+# The same keys as lowercase substrings, for ASCII input: str.lower() folds
+# ASCII exactly like re.IGNORECASE, so plain substring checks find the same
+# keys as _CREDENTIAL_KEY_SCAN at a fraction of the cost. Non-ASCII input
+# keeps the regex, whose case folding also matches e.g. 'ſ' and 'ı'.
+_CREDENTIAL_KEY_SUBSTRINGS = (
+    ('password', ('password',)),
+    ('pwd', ('pwd',)),
+    ('secret', ('secret',)),
+    ('api_key', ('apikey', 'api_key', 'api-key')),
+    ('token', ('token',)),
+    ('bearer', ('bearer',)),
+)
+
 # SECURITY: SQL identifier validation pattern
 # Restricted to alphanumeric and underscore only (no @, #, $ which can be exploited)
 # This is more restrictive than SQL Server allows, but safer for dynamic SQL
-SQL_IDENTIFIER_PATTERN = re.compile(r'^[a-zA-Z_][a-zA-Z0-9_]*$')
+# Always applied with fullmatch(): a "$" anchor would also accept a trailing newline.
+# validate_sql_identifier checks the same grammar with str.isascii() and
+# str.isidentifier(), which for ASCII strings accept exactly this pattern.
+SQL_IDENTIFIER_PATTERN = re.compile(r'[a-zA-Z_][a-zA-Z0-9_]*')
+
+# SECURITY: SQL Server type names, optionally sized: INT, NVARCHAR(50),
+# NUMERIC(18,2), VARCHAR(MAX). Applied with fullmatch().
+SQL_TYPE_PATTERN = re.compile(
+    r'([a-zA-Z][a-zA-Z0-9_]*)(?:\(\s*(?:[0-9]+(?:\s*,\s*[0-9]+)?|MAX)\s*\))?',
+    re.IGNORECASE,
+)
+
+# sanitize_sql_identifier: characters to replace, and underscore runs to collapse
+_INVALID_IDENTIFIER_CHARS = re.compile(r'[^a-zA-Z0-9_]')
+_UNDERSCORE_RUNS = re.compile(r'_+')
+
+# Same replacement as _INVALID_IDENTIFIER_CHARS for ASCII input, as a
+# complete 128-entry str.translate table
+_SANITIZE_TABLE = str.maketrans({
+    chr(i): chr(i) if chr(i).isalnum() or chr(i) == '_' else '_'
+    for i in range(128)
+})
 
 # Maximum identifier length (SQL Server limit)
 MAX_IDENTIFIER_LENGTH = 128
@@ -45,6 +90,9 @@ SQL_RESERVED_KEYWORDS = frozenset({
     'COMMIT', 'ROLLBACK', 'TRANSACTION', 'PROCEDURE', 'FUNCTION', 'TRIGGER',
 })
 
+# Identifiers longer than every keyword can skip the upper-cased lookup
+_MAX_KEYWORD_LENGTH = max(map(len, SQL_RESERVED_KEYWORDS))
+
 
 def redact_connection_string(connection_string: str) -> str:
     """
@@ -70,16 +118,60 @@ def redact_connection_string(connection_string: str) -> str:
     if not connection_string:
         return connection_string
 
+    if connection_string.isascii():
+        lowered = connection_string.lower()
+        keys = {
+            key
+            for key, substrings in _CREDENTIAL_KEY_SUBSTRINGS
+            if any(substring in lowered for substring in substrings)
+        }
+    else:
+        keys = {match.lastgroup for match in _CREDENTIAL_KEY_SCAN.finditer(connection_string)}
+    if not keys:
+        return connection_string
+
     result = connection_string
-    for pattern, replacement in CREDENTIAL_PATTERNS:
-        result = pattern.sub(replacement, result)
+    for key, pattern, replacement in CREDENTIAL_PATTERNS:
+        if key in keys:
+            result = pattern.sub(replacement, result)
 
     return result
 
 
+# Keys that indicate the entire value should be redacted, normalized like
+# dict keys are (underscores removed)
+_FULLY_SENSITIVE_KEYS = tuple({
+    key.replace('_', '')
+    for key in (
+        'password', 'pwd', 'secret', 'api_key', 'apikey',
+        'token', 'bearer', 'credential', 'private_key', 'access_key',
+        'secret_key', 'auth_token', 'refresh_token', 'access_token',
+    )
+})
+# Keys that may contain credentials within the value (like connection strings)
+_PARTIAL_SENSITIVE_KEYS = ('connection_string',)
+
+# How a string value is redacted, by key (see _credential_key_kind)
+_KEEP, _REDACT_FULLY, _REDACT_PARTIALLY = 0, 1, 2
+
+
+@lru_cache(maxsize=1024)
+def _credential_key_kind(key: str) -> int:
+    """Classify a dict key; config trees repeat the same keys, so memoize."""
+    lower_key = key.lower()
+    # Normalize key for matching (handle variations like access_token, accessToken)
+    normalized_key = lower_key.replace('_', '').replace('-', '')
+
+    if any(sk in normalized_key or normalized_key in sk for sk in _FULLY_SENSITIVE_KEYS):
+        return _REDACT_FULLY
+    if any(sk in lower_key for sk in _PARTIAL_SENSITIVE_KEYS):
+        return _REDACT_PARTIALLY
+    return _KEEP
+
+
 def redact_dict_credentials(data: dict[str, Any]) -> dict[str, Any]:
     """
-    Recursively redact credentials from a dictionary.
+    Redact credentials from a dictionary and all dictionaries nested in it.
 
     Looks for keys containing 'connection_string', 'password', 'secret', etc.
     and redacts their values.
@@ -90,48 +182,48 @@ def redact_dict_credentials(data: dict[str, Any]) -> dict[str, Any]:
     Returns:
         New dictionary with credentials redacted.
     """
-    # Keys that indicate the entire value should be redacted
-    fully_sensitive_keys = {
-        'password', 'pwd', 'secret', 'api_key', 'apikey',
-        'token', 'bearer', 'credential', 'private_key', 'access_key',
-        'secret_key', 'auth_token', 'refresh_token', 'access_token'
-    }
-    # Keys that may contain credentials within the value (like connection strings)
-    partial_sensitive_keys = {'connection_string'}
-
-    result = {}
-
-    for key, value in data.items():
-        lower_key = key.lower()
-        # Normalize key for matching (handle variations like access_token, accessToken)
-        normalized_key = lower_key.replace('_', '').replace('-', '')
-
-        if isinstance(value, dict):
-            result[key] = redact_dict_credentials(value)
-        elif isinstance(value, list):
-            result[key] = [
-                redact_dict_credentials(item) if isinstance(item, dict) else item
-                for item in value
-            ]
-        elif isinstance(value, str):
-            # Check if key matches any fully sensitive pattern
-            is_fully_sensitive = any(
-                sk.replace('_', '') in normalized_key or normalized_key in sk.replace('_', '')
-                for sk in fully_sensitive_keys
-            )
-            # Check if key matches partial sensitive pattern
-            is_partial_sensitive = any(sk in lower_key for sk in partial_sensitive_keys)
-
-            if is_fully_sensitive:
-                # Fully redact the entire value
-                result[key] = '***REDACTED***'
-            elif is_partial_sensitive:
-                # Apply pattern-based redaction
-                result[key] = redact_connection_string(value)
+    result: dict[str, Any] = {}
+    # Walk with an explicit stack of (source, copy) pairs so deeply nested
+    # configs cannot hit the recursion limit. A (source, None) entry marks
+    # leaving source, so on_path holds the dicts enclosing the current one.
+    stack: list[tuple[dict, Optional[dict]]] = [(data, result)]
+    on_path: set[int] = set()
+
+    while stack:
+        source, target = stack.pop()
+        if target is None:
+            on_path.discard(id(source))
+            continue
+        if id(source) in on_path:
+            raise ValueError("Cannot redact a dictionary that contains itself")
+        on_path.add(id(source))
+        stack.append((source, None))
+
+        for key, value in source.items():
+            if isinstance(value, dict):
+                target[key] = child = {}
+                stack.append((value, child))
+            elif isinstance(value, list):
+                items = []
+                for item in value:
+                    if isinstance(item, dict):
+                        child = {}
+                        stack.append((item, child))
+                        item = child
+                    items.append(item)
+                target[key] = items
+            elif isinstance(value, str):
+                kind = _credential_key_kind(key)
+                if kind == _REDACT_FULLY:
+                    # Fully redact the entire value
+                    target[key] = '***REDACTED***'
+                elif kind == _REDACT_PARTIALLY:
+                    # Apply pattern-based redaction
+                    target[key] = redact_connection_string(value)
+                else:
+                    target[key] = value
             else:
-                result[key] = value
-        else:
-            result[key] = value
+                target[key] = value
 
     return result
 
@@ -167,22 +259,63 @@ def validate_sql_identifier(identifier: str, allow_reserved: bool = False) -> bo
         >>> validate_sql_identifier("SELECT", allow_reserved=True)
         True
     """
-    if not identifier:
+    if not isinstance(identifier, str) or not identifier:
         return False
 
     if len(identifier) > MAX_IDENTIFIER_LENGTH:
         return False
 
-    if not SQL_IDENTIFIER_PATTERN.match(identifier):
+    return _validate_impl(identifier, allow_reserved)
+
+
+# SSIS packages repeat the same column names across tables and lineages, so
+# the checks below are memoized. Only non-empty strings within the length
+# limit reach the caches: other input is unhashable or never worth keeping.
+@lru_cache(maxsize=4096)
+def _validate_impl(identifier: str, allow_reserved: bool) -> bool:
+    """Check the grammar and keywords of a bounded, non-empty identifier."""
+    # Equivalent to SQL_IDENTIFIER_PATTERN.fullmatch, without the regex engine
+    if not (identifier.isascii() and identifier.isidentifier()):
         return False
 
     # Check for reserved keywords unless explicitly allowed
-    if not allow_reserved and identifier.upper() in SQL_RESERVED_KEYWORDS:
+    if (
+        not allow_reserved
+        and len(identifier) <= _MAX_KEYWORD_LENGTH
+        and identifier.upper() in SQL_RESERVED_KEYWORDS
+    ):
         return False
 
     return True
 
 
+def validate_sql_identifiers(
+    identifiers: Iterable[str], allow_reserved: bool = False
+) -> list[str]:
+    """
+    Validate many SQL identifiers at once without raising.
+
+    Lets callers check a whole batch (e.g. all columns of a table) up front
+    and raise a single SQLIdentifierError only when something is invalid.
+
+    Args:
+        identifiers: The identifiers to validate.
+        allow_reserved: If True, allow SQL reserved keywords (default: False).
+
+    Returns:
+        The invalid identifiers, in input order; empty if all are valid.
+
+    Example:
+        >>> validate_sql_identifiers(["customer_id", "1invalid", "order_date"])
+        ['1invalid']
+    """
+    return [
+        identifier
+        for identifier in identifiers
+        if not validate_sql_identifier(identifier, allow_reserved)
+    ]
+
+
 def sanitize_sql_identifier(identifier: str) -> str:
     """
     Sanitize a string to be a valid SQL identifier.
@@ -204,28 +337,46 @@ def sanitize_sql_identifier(identifier: str) -> str:
         >>> sanitize_sql_identifier("@variable")
         '_variable'
     """
-    if not identifier:
+    if not isinstance(identifier, str) or not identifier:
         return "_unnamed"
 
+    # Over-long names are truncated below; don't let them fill the cache
+    if len(identifier) > MAX_IDENTIFIER_LENGTH:
+        return _sanitize_impl(identifier)
+
+    return _sanitize_cached(identifier)
+
+
+def _sanitize_impl(identifier: str) -> str:
+    """Sanitize a non-empty identifier; see sanitize_sql_identifier."""
     # Replace invalid characters with underscores (more restrictive - no @, #, $)
-    sanitized = re.sub(r'[^a-zA-Z0-9_]', '_', identifier)
+    if identifier.isascii():
+        sanitized = identifier.translate(_SANITIZE_TABLE)
+    else:
+        sanitized = _INVALID_IDENTIFIER_CHARS.sub('_', identifier)
 
     # Ensure it starts with a valid character
     if sanitized and not sanitized[0].isalpha() and sanitized[0] != '_':
         sanitized = '_' + sanitized
 
     # Remove consecutive underscores
-    sanitized = re.sub(r'_+', '_', sanitized)
+    if '__' in sanitized:
+        sanitized = _UNDERSCORE_RUNS.sub('_', sanitized)
 
     # Truncate if too long
     if len(sanitized) > MAX_IDENTIFIER_LENGTH:
         sanitized = sanitized[:MAX_IDENTIFIER_LENGTH]
 
     # Handle reserved keywords by adding suffix
-    if sanitized.upper() in SQL_RESERVED_KEYWORDS:
+    if len(sanitized) <= _MAX_KEYWORD_LENGTH and sanitized.upper() in SQL_RESERVED_KEYWORDS:
         sanitized = sanitized + '_col'
 
-    return sanitized or "_unnamed"
+    # Distinct raw names often sanitize to the same identifier ("Customer ID",
+    # "Customer-ID"), so intern it to share one string across the package
+    return sys.intern(sanitized) if sanitized else "_unnamed"
+
+
+_sanitize_cached = lru_cache(maxsize=4096)(_sanitize_impl)
 
 
 class SQLIdentifierError(ValueError):
@@ -236,6 +387,11 @@ class SQLIdentifierError(ValueError):
         self.reason = reason
         super().__init__(f"{reason}: '{identifier}'")
 
+    def __reduce__(self):
+        # Rebuild from the original arguments so the error survives pickling
+        # (e.g. when raised in a parse_packages worker process)
+        return type(self), (self.identifier, self.reason)
+
 
 class PathTraversalError(ValueError):
     """Raised when a path traversal attempt is detected."""
@@ -245,6 +401,11 @@ class PathTraversalError(ValueError):
         self.reason = reason
         super().__init__(f"{reason}: '{path}'")
 
+    def __reduce__(self):
+        # Rebuild from the original arguments so the error survives pickling
+        # (e.g. when raised in a parse_packages worker process)
+        return type(self), (self.path, self.reason)
+
 
 def validate_safe_path(file_path: str, base_path: str) -> bool:
     """
@@ -260,8 +421,6 @@ def validate_safe_path(file_path: str, base_path: str) -> bool:
     Raises:
         PathTraversalError: If path traversal is detected.
     """
-    from pathlib import Path
-
     if not file_path or not base_path:
         return False
 
@@ -270,12 +429,20 @@ def validate_safe_path(file_path: str, base_path: str) -> bool:
         raise PathTraversalError(file_path, "Path contains '..'")
 
     try:
-        resolved_base = Path(base_path).resolve()
-        resolved_file = (resolved_base / file_path).resolve()
-
-        # Ensure the resolved path is under the base path
-        resolved_file.relative_to(resolved_base)
-        return True
-
+        # os.path.realpath still follows symlinks (like Path.resolve) but
+        # works on plain strings instead of building Path objects
+        resolved_base = os.path.normcase(os.path.realpath(base_path))
+        resolved_file = os.path.normcase(
+            os.path.realpath(os.path.join(resolved_base, file_path))
+        )
     except ValueError:
+        # Embedded null bytes
         raise PathTraversalError(file_path, "Path escapes base directory")
+
+    # Ensure the resolved path is under the base path; joining '' adds the
+    # trailing separator so '/base' does not admit '/base-other'
+    if resolved_file != resolved_base and not resolved_file.startswith(
+        os.path.join(resolved_base, '')
+    ):
+        raise PathTraversalError(file_path, "Path escapes base directory")
+    return True
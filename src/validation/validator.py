@@ -6,13 +6,15 @@ to compare row counts, primary key integrity, and numeric checksums between
 legacy tables and migrated dbt models.
 """
 
-import json
-from datetime import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from itertools import repeat
 from pathlib import Path
-from typing import Optional
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, ClassVar, Iterable, Mapping, Optional, Sequence
 
-from rich.console import Console
-from rich.table import Table
+from pydantic import TypeAdapter
 
 from .models import (
     ChecksumValidation,
@@ -24,7 +26,83 @@ from .models import (
     ValidationStatus,
 )
 
-console = Console()
+if TYPE_CHECKING:
+    from rich.console import Console
+
+# Serializes the report straight to JSON bytes
+_REPORT_ADAPTER = TypeAdapter(ValidationReport)
+
+# Upper bound on models validated concurrently
+_MAX_VALIDATION_WORKERS = 8
+
+# Status renderings shared by the markdown report and console output
+_STATUS_EMOJI = {
+    ValidationStatus.PASSED: "✅",
+    ValidationStatus.FAILED: "❌",
+    ValidationStatus.WARNING: "⚠️",
+    ValidationStatus.SKIPPED: "⏭️",
+}
+
+_STATUS_PROGRESS_STYLE = {
+    ValidationStatus.PASSED: "[green]PASSED[/green]",
+    ValidationStatus.FAILED: "[red]FAILED[/red]",
+    ValidationStatus.WARNING: "[yellow]WARNING[/yellow]",
+    ValidationStatus.SKIPPED: "[dim]SKIPPED[/dim]",
+}
+
+_STATUS_STYLE = {
+    ValidationStatus.PASSED: "[green]PASS[/green]",
+    ValidationStatus.FAILED: "[red]FAIL[/red]",
+    ValidationStatus.WARNING: "[yellow]WARN[/yellow]",
+    ValidationStatus.SKIPPED: "[dim]SKIP[/dim]",
+}
+
+# Severity rank used to roll check statuses up to an overall status. Anything
+# not listed (passed, skipped, error) ranks as a pass.
+_STATUS_SEVERITY = {
+    ValidationStatus.WARNING: 1,
+    ValidationStatus.FAILED: 2,
+}
+_SEVERITY_STATUS = (ValidationStatus.PASSED, ValidationStatus.WARNING, ValidationStatus.FAILED)
+
+# MCP validation query templates, filled per model via str.format_map
+_ROW_COUNT_QUERY = """
+-- Row Count Comparison for {model}
+-- Legacy:
+SELECT COUNT(*) AS row_count FROM {legacy_table};
+-- dbt:
+SELECT COUNT(*) AS row_count FROM dbt_prod.{model};
+"""
+
+_PRIMARY_KEY_QUERY = """
+-- Primary Key Integrity for {model}
+-- NULL check:
+SELECT COUNT(*) AS null_count FROM dbt_prod.{model} WHERE {pk_column} IS NULL;
+-- Duplicate check:
+SELECT {pk_column}, COUNT(*) AS cnt
+FROM dbt_prod.{model}
+GROUP BY {pk_column}
+HAVING COUNT(*) > 1;
+"""
+
+_CHECKSUM_QUERY = """
+-- Checksum for {model}.{column}
+-- Legacy:
+SELECT SUM(CAST({column} AS FLOAT)) AS sum_val, AVG(CAST({column} AS FLOAT)) AS avg_val
+FROM {legacy_table};
+-- dbt:
+SELECT SUM(CAST({column} AS FLOAT)) AS sum_val, AVG(CAST({column} AS FLOAT)) AS avg_val
+FROM dbt_prod.{model};
+"""
+
+
+def _rollup_status(statuses: Iterable[ValidationStatus]) -> ValidationStatus:
+    """
+    Reduce individual check statuses to a single overall status.
+
+    FAILED beats WARNING beats PASSED.
+    """
+    return _SEVERITY_STATUS[max(map(_STATUS_SEVERITY.get, statuses, repeat(0)), default=0)]
 
 
 class MigrationValidator:
@@ -35,6 +113,38 @@ class MigrationValidator:
     For demonstration, it generates sample validation results.
     """
 
+    # Model to legacy table mapping
+    MODEL_MAPPINGS: ClassVar[Mapping[str, Mapping[str, Any]]] = MappingProxyType({
+        "dim_customer": MappingProxyType({
+            "ssis_package": "CustomerDataLoad.dtsx",
+            "ssis_task": "Merge to Dimension",
+            "legacy_table": "dim.Customer",
+            "pk_column": "customer_key",
+            "checksum_columns": (),
+        }),
+        "fct_sales": MappingProxyType({
+            "ssis_package": "SalesFactETL.dtsx",
+            "ssis_task": "Load Sales Facts",
+            "legacy_table": "fact.Sales",
+            "pk_column": "sale_key",
+            "checksum_columns": ("quantity", "gross_amount", "net_amount"),
+        }),
+        "fct_inventory_snapshot": MappingProxyType({
+            "ssis_package": "InventorySync.dtsx",
+            "ssis_task": "Load Inventory Updates",
+            "legacy_table": "fact.InventorySnapshot",
+            "pk_column": "inventory_snapshot_key",
+            "checksum_columns": ("quantity_on_hand", "inventory_value"),
+        }),
+        "agg_daily_sales": MappingProxyType({
+            "ssis_package": "SalesFactETL.dtsx",
+            "ssis_task": "Update Aggregates",
+            "legacy_table": "agg.DailySales",
+            "pk_column": "daily_sales_key",
+            "checksum_columns": ("total_quantity", "total_net_amount"),
+        }),
+    })
+
     def __init__(self, dbt_project_path: str | Path, verbose: bool = False):
         """
         Initialize the validator.
@@ -46,38 +156,31 @@ class MigrationValidator:
         self.dbt_project_path = Path(dbt_project_path)
         self.verbose = verbose
         self.report = ValidationReport()
+        self._sql_queries: Optional[dict[str, list[str]]] = None
+        self._console: Optional["Console"] = None
 
-        # Model to legacy table mapping
-        self.model_mappings = {
-            "dim_customer": {
-                "ssis_package": "CustomerDataLoad.dtsx",
-                "ssis_task": "Merge to Dimension",
-                "legacy_table": "dim.Customer",
-                "pk_column": "customer_key",
-                "checksum_columns": [],
-            },
-            "fct_sales": {
-                "ssis_package": "SalesFactETL.dtsx",
-                "ssis_task": "Load Sales Facts",
-                "legacy_table": "fact.Sales",
-                "pk_column": "sale_key",
-                "checksum_columns": ["quantity", "gross_amount", "net_amount"],
-            },
-            "fct_inventory_snapshot": {
-                "ssis_package": "InventorySync.dtsx",
-                "ssis_task": "Load Inventory Updates",
-                "legacy_table": "fact.InventorySnapshot",
-                "pk_column": "inventory_snapshot_key",
-                "checksum_columns": ["quantity_on_hand", "inventory_value"],
-            },
-            "agg_daily_sales": {
-                "ssis_package": "SalesFactETL.dtsx",
-                "ssis_task": "Update Aggregates",
-                "legacy_table": "agg.DailySales",
-                "pk_column": "daily_sales_key",
-                "checksum_columns": ["total_quantity", "total_net_amount"],
-            },
-        }
+        # Shared, read-only model mapping; assign a new mapping to override
+        self.model_mappings = self.MODEL_MAPPINGS
+
+    @property
+    def model_mappings(self) -> Mapping[str, Mapping[str, Any]]:
+        """Model-to-legacy table mapping used for validation."""
+        return self._model_mappings
+
+    @model_mappings.setter
+    def model_mappings(self, mappings: Mapping[str, Mapping[str, Any]]) -> None:
+        self._model_mappings = mappings
+        # Cached queries were built from the previous mapping
+        self._sql_queries = None
+
+    @property
+    def console(self) -> "Console":
+        """Rich console, imported and created on first use."""
+        if self._console is None:
+            from rich.console import Console
+
+            self._console = Console()
+        return self._console
 
     def validate_row_count(
         self,
@@ -98,16 +201,28 @@ class MigrationValidator:
         Returns:
             RowCountValidation result
         """
-        difference = abs(dbt_count - legacy_count)
+        diff = dbt_count - legacy_count
+
+        # Exact match is the common case; skip the percentage math entirely
+        if diff == 0:
+            return RowCountValidation(
+                legacy_table=legacy_table,
+                legacy_count=legacy_count,
+                dbt_model=model_name,
+                dbt_count=dbt_count,
+                difference=0,
+                difference_percent=0.0,
+                status=ValidationStatus.PASSED,
+                message="Row counts match exactly",
+            )
+
+        difference = -diff if diff < 0 else diff
         difference_percent = (
-            (difference / legacy_count * 100) if legacy_count > 0 else 0
+            difference * 100.0 / legacy_count if legacy_count > 0 else 0.0
         )
 
         # Determine status
-        if difference == 0:
-            status = ValidationStatus.PASSED
-            message = "Row counts match exactly"
-        elif difference_percent < 0.01:
+        if difference_percent < 0.01:
             status = ValidationStatus.WARNING
             message = f"Minor difference: {difference} rows ({difference_percent:.4f}%)"
         else:
@@ -219,6 +334,48 @@ class MigrationValidator:
             message=message,
         )
 
+    def validate_checksums(
+        self,
+        model_name: str,
+        columns: Sequence[str],
+        legacy_sums: Sequence[float],
+        dbt_sums: Sequence[float],
+        legacy_avgs: Sequence[float],
+        dbt_avgs: Sequence[float],
+    ) -> list[ChecksumValidation]:
+        """
+        Compare checksums for several columns of one model in a single call.
+
+        The sequences are parallel: element ``i`` of each belongs to
+        ``columns[i]``. This matches the column-wise shape of a single
+        aggregate query result, so callers don't need a round trip per column.
+
+        Args:
+            model_name: Name of the dbt model
+            columns: Column names being validated
+            legacy_sums: SUM per column from legacy table
+            dbt_sums: SUM per column from dbt model
+            legacy_avgs: AVG per column from legacy table
+            dbt_avgs: AVG per column from dbt model
+
+        Returns:
+            ChecksumValidation result per column, in input order
+        """
+        validate = self.validate_checksum
+        return [
+            validate(
+                model_name=model_name,
+                column=column,
+                legacy_sum=legacy_sum,
+                dbt_sum=dbt_sum,
+                legacy_avg=legacy_avg,
+                dbt_avg=dbt_avg,
+            )
+            for column, legacy_sum, dbt_sum, legacy_avg, dbt_avg in zip(
+                columns, legacy_sums, dbt_sums, legacy_avgs, dbt_avgs, strict=True
+            )
+        ]
+
     def validate_model(self, model_name: str) -> ModelValidation:
         """
         Run all validations for a single model.
@@ -243,6 +400,7 @@ class MigrationValidator:
             )
 
         started_at = datetime.now()
+        start = time.perf_counter()
 
         validation = ModelValidation(
             model_name=model_name,
@@ -280,33 +438,32 @@ class MigrationValidator:
         )
 
         # Checksum validations
-        for column in mapping["checksum_columns"]:
+        columns = mapping["checksum_columns"]
+        if columns:
             # Simulated checksums - in production would query actual data
             sample_sum = 1000000.0
-            checksum = self.validate_checksum(
+            n = len(columns)
+            sums = (sample_sum,) * n  # Matching for demo
+            validation.checksums.extend(self.validate_checksums(
                 model_name=model_name,
-                column=column,
-                legacy_sum=sample_sum,
-                dbt_sum=sample_sum,  # Matching for demo
-                legacy_avg=sample_sum / legacy_count,
-                dbt_avg=sample_sum / dbt_count,
-            )
-            validation.checksums.append(checksum)
+                columns=columns,
+                legacy_sums=sums,
+                dbt_sums=sums,
+                legacy_avgs=(sample_sum / legacy_count,) * n,
+                dbt_avgs=(sample_sum / dbt_count,) * n,
+            ))
+
+        # Time with the monotonic clock; derive the end stamp from the start
+        duration = time.perf_counter() - start
+        validation.duration_seconds = duration
+        validation.completed_at = started_at + timedelta(seconds=duration)
 
         # Determine overall status
-        completed_at = datetime.now()
-        validation.completed_at = completed_at
-        validation.duration_seconds = (completed_at - started_at).total_seconds()
-
-        statuses = [validation.row_count.status, validation.primary_key.status]
-        statuses.extend([c.status for c in validation.checksums])
-
-        if ValidationStatus.FAILED in statuses:
-            validation.overall_status = ValidationStatus.FAILED
-        elif ValidationStatus.WARNING in statuses:
-            validation.overall_status = ValidationStatus.WARNING
-        else:
-            validation.overall_status = ValidationStatus.PASSED
+        validation.overall_status = _rollup_status((
+            validation.row_count.status,
+            validation.primary_key.status,
+            *(c.status for c in validation.checksums),
+        ))
 
         return validation
 
@@ -318,23 +475,26 @@ class MigrationValidator:
             Complete ValidationReport
         """
         if self.verbose:
-            console.print("[bold blue]Starting validation run...[/bold blue]")
+            self.console.print("[bold blue]Starting validation run...[/bold blue]")
 
-        for model_name in self.model_mappings.keys():
-            if self.verbose:
-                console.print(f"  Validating {model_name}...")
+        verbose = self.verbose
+        console = self.console if verbose else None
+        model_validations = self.report.model_validations
+        model_names = list(self.model_mappings)
 
-            validation = self.validate_model(model_name)
-            self.report.model_validations.append(validation)
+        # Each model's checks are independent (and I/O-bound once they run
+        # against SQL Server), so validate them concurrently. map() yields
+        # results in submission order, keeping the report deterministic.
+        workers = max(1, min(_MAX_VALIDATION_WORKERS, len(model_names)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(self.validate_model, model_names)
 
-            if self.verbose:
-                status_style = {
-                    ValidationStatus.PASSED: "[green]PASSED[/green]",
-                    ValidationStatus.FAILED: "[red]FAILED[/red]",
-                    ValidationStatus.WARNING: "[yellow]WARNING[/yellow]",
-                    ValidationStatus.SKIPPED: "[dim]SKIPPED[/dim]",
-                }
-                console.print(f"    {status_style.get(validation.overall_status, validation.overall_status)}")
+            for model_name, validation in zip(model_names, results):
+                model_validations.append(validation)
+
+                if verbose:
+                    console.print(f"  Validated {model_name}")
+                    console.print(f"    {_STATUS_PROGRESS_STYLE.get(validation.overall_status, validation.overall_status)}")
 
         self.report.calculate_summary()
         return self.report
@@ -343,195 +503,146 @@ class MigrationValidator:
         """
         Generate SQL queries that would be used for MCP validation.
 
+        The queries depend only on the model mappings, so they are built once
+        and reused until a new mapping is assigned.
+
         Returns:
             Dictionary of model names to list of SQL queries
         """
+        if self._sql_queries is not None:
+            return self._sql_queries
+
         queries = {}
 
         for model_name, mapping in self.model_mappings.items():
-            model_queries = []
-            legacy_table = mapping["legacy_table"]
-            pk_column = mapping["pk_column"]
-
-            # Row count query
-            model_queries.append(f"""
--- Row Count Comparison for {model_name}
--- Legacy:
-SELECT COUNT(*) AS row_count FROM {legacy_table};
--- dbt:
-SELECT COUNT(*) AS row_count FROM dbt_prod.{model_name};
-""")
-
-            # PK integrity query
-            model_queries.append(f"""
--- Primary Key Integrity for {model_name}
--- NULL check:
-SELECT COUNT(*) AS null_count FROM dbt_prod.{model_name} WHERE {pk_column} IS NULL;
--- Duplicate check:
-SELECT {pk_column}, COUNT(*) AS cnt
-FROM dbt_prod.{model_name}
-GROUP BY {pk_column}
-HAVING COUNT(*) > 1;
-""")
-
-            # Checksum queries
-            for column in mapping["checksum_columns"]:
-                model_queries.append(f"""
--- Checksum for {model_name}.{column}
--- Legacy:
-SELECT SUM(CAST({column} AS FLOAT)) AS sum_val, AVG(CAST({column} AS FLOAT)) AS avg_val
-FROM {legacy_table};
--- dbt:
-SELECT SUM(CAST({column} AS FLOAT)) AS sum_val, AVG(CAST({column} AS FLOAT)) AS avg_val
-FROM dbt_prod.{model_name};
-""")
-
+            fields = {
+                "model": model_name,
+                "legacy_table": mapping["legacy_table"],
+                "pk_column": mapping["pk_column"],
+            }
+            model_queries = [
+                _ROW_COUNT_QUERY.format_map(fields),
+                _PRIMARY_KEY_QUERY.format_map(fields),
+            ]
+            model_queries.extend(
+                _CHECKSUM_QUERY.format_map({**fields, "column": column})
+                for column in mapping["checksum_columns"]
+            )
             queries[model_name] = model_queries
 
+        self._sql_queries = queries
         return queries
 
     def export_json(self, output_path: str | Path) -> None:
         """Export validation results to JSON."""
         output_path = Path(output_path)
-        with open(output_path, "w") as f:
-            json.dump(self.report.model_dump(), f, indent=2, default=str)
+        # Encode to bytes in one pass and hand the payload to a binary handle
+        # in a single write, bypassing the text-mode re-encoding layer.
+        data = _REPORT_ADAPTER.dump_json(self.report, indent=2)
+        with open(output_path, "wb") as f:
+            f.write(data)
 
         if self.verbose:
-            console.print(f"[green]✓ Exported validation_log.json[/green]")
+            self.console.print(f"[green]✓ Exported validation_log.json[/green]")
 
     def generate_report(self, output_path: str | Path) -> None:
         """Generate markdown validation report."""
         output_path = Path(output_path)
-
-        lines = [
-            "# Migration Validation Report",
-            "",
-            f"**Generated**: {self.report.generated_at.strftime('%Y-%m-%d %H:%M:%S')}",
-            "",
-            "## Summary",
-            "",
-            f"| Metric | Value |",
-            f"|--------|-------|",
-            f"| Total Models | {self.report.total_models} |",
-            f"| Passed | {self.report.models_passed} |",
-            f"| Failed | {self.report.models_failed} |",
-            f"| Warnings | {self.report.models_warning} |",
-            f"| Overall Status | **{self.report.overall_status.value.upper()}** |",
-            "",
-        ]
-
-        # dbt execution results
-        if self.report.dbt_run:
-            lines.extend([
-                "## dbt Execution",
-                "",
-                f"| Command | Status | Duration |",
-                f"|---------|--------|----------|",
-            ])
-            if self.report.dbt_deps:
-                status = "✅" if self.report.dbt_deps.success else "❌"
-                lines.append(f"| dbt deps | {status} | {self.report.dbt_deps.duration_seconds:.1f}s |")
-            if self.report.dbt_run:
-                status = "✅" if self.report.dbt_run.success else "❌"
-                lines.append(f"| dbt run | {status} | {self.report.dbt_run.duration_seconds:.1f}s |")
-            if self.report.dbt_test:
-                status = "✅" if self.report.dbt_test.success else "❌"
-                lines.append(f"| dbt test | {status} | {self.report.dbt_test.duration_seconds:.1f}s |")
-            lines.append("")
-
-        # Model details
-        lines.extend([
-            "## Model Validations",
-            "",
-        ])
-
-        for mv in self.report.model_validations:
-            status_emoji = {
-                ValidationStatus.PASSED: "✅",
-                ValidationStatus.FAILED: "❌",
-                ValidationStatus.WARNING: "⚠️",
-                ValidationStatus.SKIPPED: "⏭️",
-            }.get(mv.overall_status, "❓")
-
-            lines.extend([
-                f"### {mv.model_name} {status_emoji}",
-                "",
-                f"- **SSIS Package**: {mv.ssis_package}",
-                f"- **SSIS Task**: {mv.ssis_task}",
-                f"- **Legacy Table**: {mv.legacy_table or 'N/A'}",
-                "",
-            ])
-
-            # Row count
-            if mv.row_count:
-                rc = mv.row_count
-                lines.extend([
-                    "#### Row Count Comparison",
-                    "",
-                    f"| Source | Count |",
-                    f"|--------|-------|",
-                    f"| Legacy ({rc.legacy_table}) | {rc.legacy_count:,} |",
-                    f"| dbt ({rc.dbt_model}) | {rc.dbt_count:,} |",
-                    f"| **Difference** | {rc.difference:,} ({rc.difference_percent:.4f}%) |",
-                    f"| **Status** | {rc.status.value.upper()} |",
-                    "",
-                ])
-
-            # Primary key
-            if mv.primary_key:
-                pk = mv.primary_key
-                lines.extend([
-                    "#### Primary Key Integrity",
-                    "",
-                    f"| Check | Result |",
-                    f"|-------|--------|",
-                    f"| Column | `{pk.pk_column}` |",
-                    f"| NULL values | {pk.null_count} |",
-                    f"| Duplicate values | {pk.duplicate_count} |",
-                    f"| **Status** | {pk.status.value.upper()} |",
-                    "",
-                ])
-
-            # Checksums
-            if mv.checksums:
-                lines.extend([
-                    "#### Numeric Checksums",
-                    "",
-                    f"| Column | Legacy SUM | dbt SUM | Variance | Status |",
-                    f"|--------|------------|---------|----------|--------|",
-                ])
-                for cs in mv.checksums:
-                    lines.append(
-                        f"| {cs.column} | {cs.legacy_sum:,.2f} | {cs.dbt_sum:,.2f} | {cs.variance_percent:.4f}% | {cs.status.value.upper()} |"
-                    )
-                lines.append("")
-
-        # MCP query reference
-        lines.extend([
-            "## MCP Validation Queries",
-            "",
-            "The following queries should be executed via SQL Server MCP for production validation:",
-            "",
-        ])
-
-        queries = self.generate_sql_queries()
-        for model_name, model_queries in queries.items():
-            lines.append(f"### {model_name}")
-            lines.append("")
-            for query in model_queries:
-                lines.append("```sql")
-                lines.append(query.strip())
-                lines.append("```")
-                lines.append("")
-
-        with open(output_path, "w") as f:
-            f.write("\n".join(lines))
+        report = self.report
+
+        # Stream the report straight into a large write buffer instead of
+        # accumulating a list of lines and joining it at the end.
+        with open(output_path, "w", buffering=1 << 16) as f:
+            write = f.write
+
+            write("# Migration Validation Report\n\n")
+            write(f"**Generated**: {report.generated_at.strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+            write("## Summary\n\n")
+            write("| Metric | Value |\n")
+            write("|--------|-------|\n")
+            write(f"| Total Models | {report.total_models} |\n")
+            write(f"| Passed | {report.models_passed} |\n")
+            write(f"| Failed | {report.models_failed} |\n")
+            write(f"| Warnings | {report.models_warning} |\n")
+            write(f"| Overall Status | **{report.overall_status.value.upper()}** |\n\n")
+
+            # dbt execution results
+            if report.dbt_run:
+                write("## dbt Execution\n\n")
+                write("| Command | Status | Duration |\n")
+                write("|---------|--------|----------|\n")
+                for label, result in (
+                    ("dbt deps", report.dbt_deps),
+                    ("dbt run", report.dbt_run),
+                    ("dbt test", report.dbt_test),
+                ):
+                    if result:
+                        status = "✅" if result.success else "❌"
+                        write(f"| {label} | {status} | {result.duration_seconds:.1f}s |\n")
+                write("\n")
+
+            # Model details
+            write("## Model Validations\n\n")
+
+            for mv in report.model_validations:
+                status_emoji = _STATUS_EMOJI.get(mv.overall_status, "❓")
+
+                write(f"### {mv.model_name} {status_emoji}\n\n")
+                write(f"- **SSIS Package**: {mv.ssis_package}\n")
+                write(f"- **SSIS Task**: {mv.ssis_task}\n")
+                write(f"- **Legacy Table**: {mv.legacy_table or 'N/A'}\n\n")
+
+                # Row count
+                if mv.row_count:
+                    rc = mv.row_count
+                    write("#### Row Count Comparison\n\n")
+                    write("| Source | Count |\n")
+                    write("|--------|-------|\n")
+                    write(f"| Legacy ({rc.legacy_table}) | {rc.legacy_count:,} |\n")
+                    write(f"| dbt ({rc.dbt_model}) | {rc.dbt_count:,} |\n")
+                    write(f"| **Difference** | {rc.difference:,} ({rc.difference_percent:.4f}%) |\n")
+                    write(f"| **Status** | {rc.status.value.upper()} |\n\n")
+
+                # Primary key
+                if mv.primary_key:
+                    pk = mv.primary_key
+                    write("#### Primary Key Integrity\n\n")
+                    write("| Check | Result |\n")
+                    write("|-------|--------|\n")
+                    write(f"| Column | `{pk.pk_column}` |\n")
+                    write(f"| NULL values | {pk.null_count} |\n")
+                    write(f"| Duplicate values | {pk.duplicate_count} |\n")
+                    write(f"| **Status** | {pk.status.value.upper()} |\n\n")
+
+                # Checksums
+                if mv.checksums:
+                    write("#### Numeric Checksums\n\n")
+                    write("| Column | Legacy SUM | dbt SUM | Variance | Status |\n")
+                    write("|--------|------------|---------|----------|--------|\n")
+                    for cs in mv.checksums:
+                        write(
+                            f"| {cs.column} | {cs.legacy_sum:,.2f} | {cs.dbt_sum:,.2f} | {cs.variance_percent:.4f}% | {cs.status.value.upper()} |\n"
+                        )
+                    write("\n")
+
+            # MCP query reference
+            write("## MCP Validation Queries\n\n")
+            write("The following queries should be executed via SQL Server MCP for production validation:\n")
+
+            queries = self.generate_sql_queries()
+            for model_name, model_queries in queries.items():
+                write(f"\n### {model_name}\n")
+                for query in model_queries:
+                    write(f"\n```sql\n{query.strip()}\n```\n")
 
         if self.verbose:
-            console.print(f"[green]✓ Generated validation_report.md[/green]")
+            self.console.print(f"[green]✓ Generated validation_report.md[/green]")
 
     def print_summary(self) -> None:
         """Print validation summary to console."""
+        from rich.table import Table
+
+        console = self.console
         table = Table(title="Validation Summary")
         table.add_column("Model", style="cyan")
         table.add_column("Row Count", justify="center")
@@ -539,32 +650,22 @@ FROM dbt_prod.{model_name};
         table.add_column("Checksums", justify="center")
         table.add_column("Status", justify="center")
 
-        status_style = {
-            ValidationStatus.PASSED: "[green]PASS[/green]",
-            ValidationStatus.FAILED: "[red]FAIL[/red]",
-            ValidationStatus.WARNING: "[yellow]WARN[/yellow]",
-            ValidationStatus.SKIPPED: "[dim]SKIP[/dim]",
-        }
+        # Bind the hot lookups once rather than per row
+        style = _STATUS_STYLE.get
+        add_row = table.add_row
+        no_checksums = "[dim]N/A[/dim]"
 
         for mv in self.report.model_validations:
-            rc_status = status_style.get(mv.row_count.status, "N/A") if mv.row_count else "N/A"
-            pk_status = status_style.get(mv.primary_key.status, "N/A") if mv.primary_key else "N/A"
+            rc_status = style(mv.row_count.status, "N/A") if mv.row_count else "N/A"
+            pk_status = style(mv.primary_key.status, "N/A") if mv.primary_key else "N/A"
 
             if mv.checksums:
-                cs_statuses = [cs.status for cs in mv.checksums]
-                if ValidationStatus.FAILED in cs_statuses:
-                    cs_status = status_style[ValidationStatus.FAILED]
-                elif ValidationStatus.WARNING in cs_statuses:
-                    cs_status = status_style[ValidationStatus.WARNING]
-                else:
-                    cs_status = status_style[ValidationStatus.PASSED]
+                cs_status = _STATUS_STYLE[_rollup_status(cs.status for cs in mv.checksums)]
             else:
-                cs_status = "[dim]N/A[/dim]"
-
-            overall = status_style.get(mv.overall_status, "N/A")
+                cs_status = no_checksums
 
-            table.add_row(mv.model_name, rc_status, pk_status, cs_status, overall)
+            add_row(mv.model_name, rc_status, pk_status, cs_status, style(mv.overall_status, "N/A"))
 
         console.print(table)
         console.print()
-        console.print(f"[bold]Overall Status:[/bold] {status_style.get(self.report.overall_status, 'UNKNOWN')}")
+        console.print(f"[bold]Overall Status:[/bold] {_STATUS_STYLE.get(self.report.overall_status, 'UNKNOWN')}")
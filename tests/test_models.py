@@ -73,8 +73,8 @@ class TestConnectionManagerRedaction:
         json_str = package.model_dump_json()
 
         # Check dict
-        assert "pass1" not in str(data)
-        assert "pass2" not in str(data)
+        dumped = [cm["connection_string"] for cm in data["connection_managers"]]
+        assert dumped == ["Server=src;Password=***REDACTED***;", "Server=dst;PWD=***REDACTED***;"]
 
         # Check JSON
         assert "pass1" not in json_str
@@ -104,6 +104,12 @@ class TestSSISPackageModel:
         package = SSISPackage(name="Empty", file_path="/path/empty.dtsx")
         assert package.total_tasks() == 0
 
+    def test_total_tasks_counts_appended_tasks(self):
+        """Should include tasks appended after construction, as the parser does."""
+        package = SSISPackage(name="Growing", file_path="/path/growing.dtsx")
+        package.data_flow_tasks.append(DataFlowTask(name="DFT1"))
+        assert package.total_tasks() == 1
+
     def test_has_manual_review_items(self):
         """Should detect script tasks requiring manual review."""
         from src.parser.models import ScriptTask
@@ -159,6 +165,21 @@ class TestColumnInfoModel:
         assert col.scale == 2
         assert col.nullable is False
 
+    def test_is_immutable(self):
+        """Should reject attribute assignment after construction."""
+        from pydantic import ValidationError
+
+        col = ColumnInfo(name="col1", ssis_type="DT_I4", sql_type="INT")
+        with pytest.raises(ValidationError):
+            col.nullable = False
+
+    def test_rejects_unknown_fields(self):
+        """Should reject fields the model does not define."""
+        from pydantic import ValidationError
+
+        with pytest.raises(ValidationError):
+            ColumnInfo(name="col1", ssis_type="DT_I4", sql_type="INT", colour="red")
+
 
 class TestVariableModel:
     """Tests for Variable model."""
@@ -228,3 +249,20 @@ class TestDataFlowTaskModel:
         )
         assert len(dft.sources) == 1
         assert dft.sources[0].table_name == "dbo.Customers"
+
+
+class TestParsedModelConstruction:
+    """Tests that parser-built models match fully validated ones."""
+
+    def test_parsed_package_round_trips(self):
+        """Revalidating a parsed package's dump should serialize identically."""
+        from pathlib import Path
+
+        from src.parser.ssis_parser import SSISParser
+
+        sample = Path(__file__).parent.parent / "samples" / "ssis_packages" / "SalesFactETL.dtsx"
+        package = SSISParser().parse_package(sample)
+        assert package.data_flow_tasks[0].sources[0].columns
+
+        dumped = package.model_dump_json()
+        assert SSISPackage.model_validate_json(dumped).model_dump_json() == dumped
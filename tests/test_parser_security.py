@@ -12,9 +12,9 @@ from src.parser.ssis_parser import SSISParser
 class TestXXEPrevention:
     """Tests to verify XXE (XML External Entity) attacks are prevented."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def parser(self):
-        """Create a fresh parser instance."""
+        """Create a parser shared by these tests (parse_package keeps no per-file state)."""
         return SSISParser()
 
     @pytest.fixture
@@ -48,7 +48,7 @@ class TestXXEPrevention:
 
         # The XXE should be blocked - entity should not be resolved
         assert "SENSITIVE_DATA_12345" not in package.name
-        assert "SENSITIVE_DATA_12345" not in str(package.model_dump())
+        assert "SENSITIVE_DATA_12345" not in package.model_dump_json()
 
     def test_external_entity_url_fetch_blocked(self, parser, temp_dir):
         """Should block attempts to fetch external URLs via XXE."""
@@ -125,41 +125,40 @@ class TestSecureParserConfiguration:
         with tempfile.TemporaryDirectory() as tmpdir:
             yield tmpdir
 
-    def test_parser_has_secure_settings(self, temp_dir):
-        """Verify the parser uses secure XML configuration by testing behavior."""
-        from src.parser.ssis_parser import _create_secure_parser
+    def test_parser_options_are_secure(self):
+        """Verify parse_package's parser options disable entity and DTD loading."""
+        from src.parser.ssis_parser import _SECURE_PARSER_OPTIONS
 
-        # Access the secure parser factory function
-        secure_parser = _create_secure_parser()
+        assert _SECURE_PARSER_OPTIONS == {
+            "resolve_entities": False,
+            "no_network": True,
+            "dtd_validation": False,
+            "load_dtd": False,
+        }
 
-        # Verify security by testing that entities are NOT resolved
-        # Create XML with an entity that should NOT be expanded
-        test_xml = os.path.join(temp_dir, "entity_test.xml")
+    def test_internal_entities_not_expanded(self, temp_dir):
+        """Verify parse_package leaves internal entities unexpanded."""
+        test_xml = os.path.join(temp_dir, "entity_test.dtsx")
         with open(test_xml, "w") as f:
             f.write('''<?xml version="1.0"?>
 <!DOCTYPE test [<!ENTITY testent "EXPANDED">]>
-<root>&testent;</root>''')
-
-        # Parse with secure parser - entity should NOT be expanded
-        tree = etree.parse(test_xml, parser=secure_parser)
-        root_text = tree.getroot().text or ""
+<DTS:Executable xmlns:DTS="www.microsoft.com/SqlServer/Dts" DTS:ObjectName="pkg">
+  <DTS:Variables>
+    <DTS:Variable DTS:Namespace="User" DTS:ObjectName="v">
+      <DTS:VariableValue>&testent;</DTS:VariableValue>
+    </DTS:Variable>
+  </DTS:Variables>
+</DTS:Executable>''')
 
         # If resolve_entities=False is working, the entity won't be expanded
-        # The text will be empty or contain the entity reference, not "EXPANDED"
-        assert "EXPANDED" not in root_text
-
-    def test_create_secure_parser_function_exists(self):
-        """Verify _create_secure_parser function exists and returns XMLParser."""
-        from src.parser.ssis_parser import _create_secure_parser
-
-        secure_parser = _create_secure_parser()
-        assert isinstance(secure_parser, etree.XMLParser)
+        package = SSISParser().parse_package(test_xml)
+        assert "EXPANDED" not in package.model_dump_json()
 
 
 class TestInputValidation:
     """Tests for input validation in parser."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def parser(self):
         return SSISParser()
 
@@ -210,3 +209,116 @@ class TestInputValidation:
         except Exception as e:
             # Should be XML parsing error, not crash
             assert e is not None
+
+
+class TestExportRedaction:
+    """Tests that exported JSON never contains raw credentials."""
+
+    def test_export_json_redacts_connection_strings(self):
+        """parsed_packages.json should carry redacted connection strings."""
+        from src.parser.models import ConnectionManager, SSISPackage
+
+        parser = SSISParser()
+        parser.packages.append(
+            SSISPackage(
+                name="Pkg",
+                file_path="/tmp/pkg.dtsx",
+                connection_managers=[
+                    ConnectionManager(
+                        id="c1",
+                        name="Src",
+                        connection_string="Server=s;Password=hunter2;",
+                    )
+                ],
+            )
+        )
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            parser.export_json(tmpdir)
+            with open(os.path.join(tmpdir, "parsed_packages.json")) as f:
+                content = f.read()
+
+        assert "hunter2" not in content
+        assert "***REDACTED***" in content
+
+
+class TestStreamingParse:
+    """Tests that streamed parsing keeps document order for nested elements."""
+
+    def test_nested_container_elements_in_document_order(self):
+        """Tasks, variables and constraints inside containers should all be found."""
+        package_xml = r'''<?xml version="1.0"?>
+<DTS:Executable xmlns:DTS="www.microsoft.com/SqlServer/Dts"
+    xmlns:SQLTask="www.microsoft.com/sqlserver/dts/tasks/sqltask"
+    DTS:ObjectName="Nested" DTS:ExecutableType="Microsoft.Package">
+  <DTS:Variables><DTS:Variable DTS:ObjectName="V1"/></DTS:Variables>
+  <DTS:Executables>
+    <DTS:Executable DTS:ObjectName="Seq" DTS:ExecutableType="STOCK:SEQUENCE">
+      <DTS:Variables><DTS:Variable DTS:ObjectName="V2"/></DTS:Variables>
+      <DTS:Executables>
+        <DTS:Executable DTS:ObjectName="S1" DTS:ExecutableType="Microsoft.ExecuteSQLTask">
+          <DTS:ObjectData><SQLTask:SqlTaskData SQLTask:SqlStatementSource="SELECT 1"/></DTS:ObjectData>
+        </DTS:Executable>
+        <DTS:Executable DTS:ObjectName="F1" DTS:ExecutableType="Microsoft.FTPTask"/>
+      </DTS:Executables>
+      <DTS:PrecedenceConstraints>
+        <DTS:PrecedenceConstraint DTS:From="Package\Seq\S1" DTS:To="Package\Seq\F1"/>
+      </DTS:PrecedenceConstraints>
+    </DTS:Executable>
+    <DTS:Executable DTS:ObjectName="S2" DTS:ExecutableType="Microsoft.ExecuteSQLTask">
+      <DTS:ObjectData><SQLTask:SqlTaskData SQLTask:SqlStatementSource="SELECT 2"/></DTS:ObjectData>
+    </DTS:Executable>
+  </DTS:Executables>
+  <DTS:PrecedenceConstraints>
+    <DTS:PrecedenceConstraint DTS:From="Package\Seq" DTS:To="Package\S2"/>
+  </DTS:PrecedenceConstraints>
+</DTS:Executable>'''
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            dtsx_file = os.path.join(tmpdir, "nested.dtsx")
+            with open(dtsx_file, "w") as f:
+                f.write(package_xml)
+            package = SSISParser().parse_package(dtsx_file)
+
+        assert package.name == "Nested"
+        assert [v.name for v in package.variables] == ["V1", "V2"]
+        assert [t.name for t in package.execute_sql_tasks] == ["S1", "S2"]
+        assert len(package.parsing_warnings) == 1
+        assert "F1" in package.parsing_warnings[0]
+        assert [(c.from_task, c.to_task) for c in package.precedence_constraints] == [
+            ("Seq\\S1", "Seq\\F1"),
+            ("Seq", "S2"),
+        ]
+
+
+class TestParallelParse:
+    """Tests that parallel parsing matches parsing files one by one."""
+
+    def test_matches_sequential_parse(self):
+        """Packages and schema metadata should equal a sequential parse."""
+        from pathlib import Path
+
+        samples = sorted((Path(__file__).parent.parent / "samples" / "ssis_packages").glob("*.dtsx"))
+        files = samples + samples[:1]
+
+        sequential = SSISParser()
+        for path in files:
+            sequential.packages.append(sequential.parse_package(path))
+
+        parallel = SSISParser()
+        result = parallel.parse_packages(files, max_workers=2)
+
+        assert result == parallel.packages
+        assert [p.model_dump_json() for p in result] == [
+            p.model_dump_json() for p in sequential.packages
+        ]
+        assert parallel.schema_metadata == sequential.schema_metadata
+
+    def test_skips_unparseable_files(self):
+        """A file that fails to parse should not stop the others."""
+        from pathlib import Path
+
+        sample = next((Path(__file__).parent.parent / "samples" / "ssis_packages").glob("*.dtsx"))
+        parser = SSISParser()
+        result = parser.parse_packages(["/nonexistent/path/file.dtsx", sample], max_workers=1)
+        assert len(result) == 1
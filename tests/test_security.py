@@ -77,6 +77,20 @@ class TestPathTraversalProtection:
 
         assert result.is_absolute()
 
+    def test_uses_pre_resolved_base(self, temp_dir):
+        """Should check against a pre-resolved base directory when given."""
+        from unittest.mock import MagicMock
+
+        mock_context = MagicMock()
+        executor = ExecutorAgent(context=mock_context)
+        resolved_base = temp_dir.resolve()
+
+        result = executor._validate_path(Path("models/a.sql"), temp_dir, resolved_base)
+        assert result == resolved_base / "models" / "a.sql"
+
+        with pytest.raises(PathTraversalError):
+            executor._validate_path(Path("../outside.sql"), temp_dir, resolved_base)
+
 
 class TestSQLInjectionProtection:
     """Tests for SQL injection protection using validate_sql_identifier."""
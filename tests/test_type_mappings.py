@@ -57,6 +57,11 @@ class TestMapSSISTypeToSQL:
         result = map_ssis_type_to_sql("wstr", length=100)
         assert result == "NVARCHAR(100)"
 
+    def test_missing_type_uses_default(self):
+        """A missing (None) type should map to the default, even with a length."""
+        assert map_ssis_type_to_sql(None) == "NVARCHAR(MAX)"
+        assert map_ssis_type_to_sql(None, length=50) == "NVARCHAR(MAX)"
+
     def test_string_without_length(self):
         """Should return base type when no length provided."""
         result = map_ssis_type_to_sql("DT_WSTR")
@@ -87,6 +92,12 @@ class TestMapSSISTypeToSQL:
         result = map_ssis_type_to_sql("DT_I4", length=10)
         assert result == "INT"
 
+    def test_case_insensitive_lookup(self):
+        """Should resolve type names regardless of case."""
+        assert map_ssis_type_to_sql("dt_wstr", length=20) == "NVARCHAR(20)"
+        assert map_ssis_type_to_sql("DBTIMESTAMP") == "DATETIME"
+        assert map_ssis_type_to_sql("Numeric", precision=18, scale=2) == "NUMERIC(18,2)"
+
 
 class TestGetDbtCastExpression:
     """Tests for get_dbt_cast_expression function."""
@@ -123,6 +134,24 @@ class TestGetDbtCastExpression:
         result = get_dbt_cast_expression("col", "DT_WSTR", "NVARCHAR(50)")
         assert result == "CAST(col AS NVARCHAR(50))"
 
+    def test_accepts_precision_and_max_sizes(self):
+        """Should accept precision/scale and MAX size specifications."""
+        assert get_dbt_cast_expression("col", "DT_NUMERIC", "NUMERIC(18, 2)") == "CAST(col AS NUMERIC(18, 2))"
+        assert get_dbt_cast_expression("col", "DT_WSTR", "NVARCHAR(MAX)") == "CAST(col AS NVARCHAR(MAX))"
+
+    def test_rejects_injection_after_size(self):
+        """Should validate the whole type, not just the part before '('."""
+        with pytest.raises(SQLIdentifierError):
+            get_dbt_cast_expression("col", "DT_WSTR", "NVARCHAR(50)); DROP TABLE users; --")
+        with pytest.raises(SQLIdentifierError):
+            get_dbt_cast_expression("col", "DT_WSTR", "NVARCHAR(50")
+
+    def test_rejects_repeated_invalid_calls(self):
+        """Memoization must not turn a rejected identifier into a cached result."""
+        for _ in range(2):
+            with pytest.raises(SQLIdentifierError):
+                get_dbt_cast_expression("bad col", "DT_I4", "INT", strict=True)
+
 
 class TestGetSnakeCase:
     """Tests for get_snake_case function."""
@@ -0,0 +1,230 @@
+"""Tests for the migration validator and its report exports."""
+
+import json
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from src.validation.models import ValidationReport, ValidationStatus
+from src.validation.validator import MigrationValidator, _rollup_status
+
+
+@pytest.fixture
+def validator():
+    """Create a validator that has run all simulated validations."""
+    v = MigrationValidator("dbt_project")
+    v.run_all_validations()
+    return v
+
+
+class TestModelMappings:
+    """Tests for the validator's model-to-legacy mapping."""
+
+    def test_shared_between_instances(self):
+        """Validators should share the class-level mapping, not copy it."""
+        first = MigrationValidator("dbt_project")
+        second = MigrationValidator("dbt_project")
+        assert first.model_mappings is second.model_mappings is MigrationValidator.MODEL_MAPPINGS
+
+    def test_read_only(self):
+        """The shared mapping must not be mutable through an instance."""
+        v = MigrationValidator("dbt_project")
+        with pytest.raises(TypeError):
+            v.model_mappings["new_model"] = {}
+        with pytest.raises(TypeError):
+            v.model_mappings["fct_sales"]["pk_column"] = "other"
+
+
+class TestValidateRowCount:
+    """Tests for row count comparison."""
+
+    def test_exact_match_passes(self, validator):
+        """Equal counts should pass with zero difference."""
+        result = validator.validate_row_count("m", "t", 100, 100)
+        assert result.status == ValidationStatus.PASSED
+        assert result.difference == 0
+        assert result.difference_percent == 0.0
+
+    def test_tiny_difference_warns(self, validator):
+        """A difference below 0.01% should only warn."""
+        result = validator.validate_row_count("m", "t", 1_000_000, 999_999)
+        assert result.status == ValidationStatus.WARNING
+        assert result.difference == 1
+
+    def test_large_difference_fails(self, validator):
+        """A difference of 0.01% or more should fail."""
+        result = validator.validate_row_count("m", "t", 100, 110)
+        assert result.status == ValidationStatus.FAILED
+        assert result.difference == 10
+        assert result.difference_percent == pytest.approx(10.0)
+
+    def test_empty_legacy_table(self, validator):
+        """Rows in dbt with an empty legacy table should not divide by zero."""
+        result = validator.validate_row_count("m", "t", 0, 5)
+        assert result.difference == 5
+        assert result.difference_percent == 0.0
+
+
+class TestValidateChecksums:
+    """Tests for batch checksum comparison."""
+
+    def test_matches_per_column_results(self, validator):
+        """Batch results should equal validating each column on its own."""
+        batch = validator.validate_checksums(
+            model_name="m",
+            columns=["a", "b", "c"],
+            legacy_sums=[100.0, 0.0, 100.0],
+            dbt_sums=[100.0, 5.0, 100.5],
+            legacy_avgs=[1.0, 0.0, 1.0],
+            dbt_avgs=[1.0, 0.5, 1.005],
+        )
+        assert [c.column for c in batch] == ["a", "b", "c"]
+        assert [c.status for c in batch] == [
+            ValidationStatus.PASSED,
+            ValidationStatus.FAILED,
+            ValidationStatus.WARNING,
+        ]
+        assert batch[2] == validator.validate_checksum("m", "c", 100.0, 100.5, 1.0, 1.005)
+
+    def test_rejects_mismatched_lengths(self, validator):
+        """Parallel sequences of different lengths should raise."""
+        with pytest.raises(ValueError):
+            validator.validate_checksums("m", ["a", "b"], [1.0], [1.0], [1.0], [1.0])
+
+
+class TestRollupStatus:
+    """Tests for reducing check statuses to an overall status."""
+
+    def test_all_passed(self):
+        """Only passing checks should roll up to PASSED."""
+        statuses = [ValidationStatus.PASSED, ValidationStatus.PASSED]
+        assert _rollup_status(statuses) == ValidationStatus.PASSED
+
+    def test_warning_beats_passed(self):
+        """A warning should win over passing checks."""
+        statuses = [ValidationStatus.PASSED, ValidationStatus.WARNING, ValidationStatus.PASSED]
+        assert _rollup_status(statuses) == ValidationStatus.WARNING
+
+    def test_failed_beats_warning(self):
+        """A failure should win regardless of position."""
+        statuses = [ValidationStatus.WARNING, ValidationStatus.FAILED, ValidationStatus.PASSED]
+        assert _rollup_status(statuses) == ValidationStatus.FAILED
+
+    def test_skipped_and_empty_roll_up_to_passed(self):
+        """Statuses without a severity, or no statuses at all, should pass."""
+        assert _rollup_status([ValidationStatus.SKIPPED]) == ValidationStatus.PASSED
+        assert _rollup_status([]) == ValidationStatus.PASSED
+
+
+class TestExportJson:
+    """Tests for JSON export of the validation report."""
+
+    def test_round_trips_through_model(self, validator):
+        """Exported JSON should load back into an equal ValidationReport."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "validation_log.json"
+            validator.export_json(path)
+            data = json.loads(path.read_text())
+
+        assert data["total_models"] == 4
+        assert data["overall_status"] == "passed"
+        assert ValidationReport.model_validate(data) == validator.report
+
+    def test_serializes_datetimes_as_iso(self, validator):
+        """Datetimes should be written as ISO 8601 strings."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "validation_log.json"
+            validator.export_json(path)
+            data = json.loads(path.read_text())
+
+        assert "T" in data["generated_at"]
+        assert "T" in data["model_validations"][0]["started_at"]
+
+
+class TestGenerateReport:
+    """Tests for the markdown validation report."""
+
+    def test_writes_all_sections(self, validator):
+        """Report should contain summary, model and query sections."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "validation_report.md"
+            validator.generate_report(path)
+            content = path.read_text()
+
+        assert content.startswith("# Migration Validation Report\n\n")
+        assert "| Overall Status | **PASSED** |" in content
+        assert "### fct_sales ✅" in content
+        assert "| quantity | 1,000,000.00 | 1,000,000.00 | 0.0000% | PASSED |" in content
+        assert "## dbt Execution" not in content
+        assert content.endswith("```\n")
+        assert "\n\n\n" not in content
+
+
+class TestGenerateSqlQueries:
+    """Tests for MCP validation query generation."""
+
+    def test_one_query_per_check(self, validator):
+        """Should emit row count, PK and one checksum query per column."""
+        queries = validator.generate_sql_queries()
+        assert len(queries["dim_customer"]) == 2
+        assert len(queries["fct_sales"]) == 5
+        assert "FROM fact.Sales;" in queries["fct_sales"][0]
+        assert "SUM(CAST(net_amount AS FLOAT))" in queries["fct_sales"][4]
+
+    def test_reuses_cached_queries(self, validator):
+        """Repeated calls should return the same cached result."""
+        assert validator.generate_sql_queries() is validator.generate_sql_queries()
+
+    def test_rebuilds_after_mapping_override(self, validator):
+        """Assigning a new mapping should drop queries built from the old one."""
+        validator.generate_sql_queries()
+        validator.model_mappings = {
+            "dim_region": {
+                "legacy_table": "dim.Region",
+                "pk_column": "region_id",
+                "checksum_columns": [],
+            }
+        }
+        queries = validator.generate_sql_queries()
+        assert list(queries) == ["dim_region"]
+        assert "FROM dim.Region;" in queries["dim_region"][0]
+
+
+class TestValidateModel:
+    """Tests for single-model validation."""
+
+    def test_timing_is_consistent(self, validator):
+        """completed_at should equal started_at plus the measured duration."""
+        result = validator.validate_model("fct_sales")
+        assert result.duration_seconds >= 0
+        assert (result.completed_at - result.started_at).total_seconds() == pytest.approx(
+            result.duration_seconds, abs=1e-6
+        )
+
+    def test_unknown_model_is_skipped(self, validator):
+        """Models without a mapping should be skipped with an error."""
+        result = validator.validate_model("does_not_exist")
+        assert result.overall_status == ValidationStatus.SKIPPED
+        assert result.errors
+
+
+class TestRunAllValidations:
+    """Tests for validating every mapped model."""
+
+    def test_results_follow_mapping_order(self, validator):
+        """Concurrent validation should still report models in mapping order."""
+        names = [mv.model_name for mv in validator.report.model_validations]
+        assert names == list(validator.model_mappings)
+
+    def test_verbose_progress_reports_finished_models(self, capsys):
+        """Verbose progress lines should describe models that have been validated."""
+        MigrationValidator("dbt_project", verbose=True).run_all_validations()
+        out = capsys.readouterr().out
+        assert "Validated fct_sales" in out
+        assert "Validating fct_sales" not in out
+
+    def test_summary_is_calculated(self, validator):
+        """Summary counters should reflect the model results."""
+        assert validator.report.total_models == len(validator.model_mappings)
+        assert validator.report.models_passed == validator.report.total_models